@@ -194,10 +194,11 @@ async def game_cpu_step(req: Dict[str, Any] = Body(...)):
     def _waiting_for() -> str:
         if manager.winner:
             return "game_over"
-        pending = manager.get_pending_request()
-        if pending and pending.get("player_id") == cpu_pid:
+        # 待ち手の判定は (player_id, action) だけで足りる（pending_actor_action は判定・副作用が一致）。
+        pa = manager.pending_actor_action()
+        if pa and pa[0] == cpu_pid:
             return "cpu"
-        if pending:
+        if pa:
             return "human_decision"
         return "human"
 
@@ -205,8 +206,8 @@ async def game_cpu_step(req: Dict[str, Any] = Body(...)):
     try:
         manager.action_events = []
         if not manager.winner:
-            pending = manager.get_pending_request()
-            if pending and pending.get("player_id") == cpu_pid:
+            pa = manager.pending_actor_action()
+            if pa and pa[0] == cpu_pid:
                 turn_mem = meta.setdefault("turn_mem", {})
                 # ⑥-a: 先行計画（pondering）が走行中なら完了を待つ（warm な queue を使う・既定 OFF）。
                 _ptask = meta.get("plan_cache", {}).get("task")
@@ -73,9 +73,10 @@ def _kick_ponder(game_id: str) -> None:
     manager = GAMES.get(game_id); meta = CPU_GAMES.get(game_id)
     if not manager or not meta or manager.winner is not None:
         return
-    pending = manager.get_pending_request()
+    # 手番判定には (player_id, action) だけで足りる（候補/request_id を作らない軽量版・判定は一致）。
+    pa = manager.pending_actor_action()
     cpu_pid = meta.get("cpu_player_id")
-    if not pending or pending.get("player_id") != cpu_pid:
+    if not pa or pa[0] != cpu_pid:
         return
     cache = meta.setdefault("plan_cache", {})
     # ⑥-b: 「人間が今エンドしたら」を投機済み（spec_queue）で、実盤面でも先頭が合法なら昇格＝投機ヒット
@@ -152,10 +153,10 @@ def _kick_speculate(game_id: str) -> None:
     manager = GAMES.get(game_id); meta = CPU_GAMES.get(game_id)
     if not manager or not meta or manager.winner is not None:
         return
-    pending = manager.get_pending_request()
+    pa = manager.pending_actor_action()
     cpu_pid = meta.get("cpu_player_id")
     # 人間（=CPU でない側）の MAIN_ACTION 決定点のときだけ投機（TURN_END が合法な静止点）。
-    if not pending or pending.get("player_id") == cpu_pid or pending.get("action") != "MAIN_ACTION":
+    if not pa or pa[0] == cpu_pid or pa[1] != "MAIN_ACTION":
         return
     cache = meta.setdefault("plan_cache", {})
     try:
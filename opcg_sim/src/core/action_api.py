@@ -78,10 +78,7 @@ def apply_game_action(manager, player, action_type: str, payload: Optional[Dict[
             raise ValueError("自分自身を攻撃対象に選択することはできません。")
         if not operating_card:
             raise ValueError("アタックするカードが見つかりません。")
-        opponent_units = [opponent.leader] + opponent.field
-        if opponent.stage:
-            opponent_units.append(opponent.stage)
-        attack_target = next((c for c in opponent_units if c and c.uuid == target_uuid), None)
+        attack_target = next((c for c in opponent.iter_units() if c.uuid == target_uuid), None)
         if not attack_target:
             raise ValueError("攻撃対象が見つかりません。")
         manager.action_events.append({"type": "ATTACK", "player": pid, "card_name": operating_card.master.name, "message": f"「{operating_card.master.name}」→「{attack_target.master.name}」攻撃"})
@@ -101,9 +98,8 @@ def apply_game_action(manager, player, action_type: str, payload: Optional[Dict[
         if not operating_card:
             raise ValueError("効果を発動するカードが見つかりません。")
         manager.action_events.append({"type": "ACTIVATE_MAIN", "player": pid, "card_name": operating_card.master.name, "message": f"「{operating_card.master.name}」の効果起動"})
-        for ability in operating_card.master.abilities:
-            if ability.trigger == TriggerType.ACTIVATE_MAIN:
-                manager.resolve_ability(current_player, ability, source_card=operating_card)
+        for ability in operating_card.master.abilities_by_trigger.get(TriggerType.ACTIVATE_MAIN, ()):
+            manager.resolve_ability(current_player, ability, source_card=operating_card)
     elif action_type == ACT_RESOLVE_SELECTION:
         manager.resolve_interaction(current_player, payload)
     elif action_type == ACT_MULLIGAN:
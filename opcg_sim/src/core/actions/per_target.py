@@ -9,8 +9,12 @@
 import re
 from ...models.enums import ActionType, Zone, TriggerType
 from ...models.models import DonInstance
+from ..engine._helpers import _nfc
 from .registry import target_handler
 
+# GRANT_KEYWORD で status が空のとき raw_text から付与キーワードを拾う（【…】の中身）。
+_KEYWORD_BRACKET_RE = re.compile(r'【([^】]+)】')
+
 
 @target_handler(ActionType.PREVENT_LEAVE)
 def prevent_leave(gm, player, action, target, owner, source_list, value, source_card):
@@ -162,11 +166,12 @@ def rest(gm, player, action, target, owner, source_list, value, source_card):
     _was_rested = target.is_rest
     target.is_rest = True
     if isinstance(target, DonInstance) and source_list is not None:
+        # source_list は target_loop が _find_card_location で引いた所在＝target を含む。
+        # 所在確認の `in` を重ねず（O(N) 走査の重複）、そのまま外してレスト領域へ移す。
         if source_list is not owner.don_rested:
-            if target in source_list:
-                source_list.remove(target)
-                owner.don_rested.append(target)
-                if hasattr(target, 'attached_to'): target.attached_to = None
+            source_list.remove(target)
+            owner.don_rested.append(target)
+            if hasattr(target, 'attached_to'): target.attached_to = None
     # アクティブ→レスト遷移で ON_REST（キャラがレストになった時）を誘発する。
     # 要因＝効果（effect_controller=player）。ドン!!は対象外。既にレストなら不発。
     if not _was_rested and not isinstance(target, DonInstance):
@@ -192,17 +197,16 @@ def play_card(gm, player, action, target, owner, source_list, value, source_card
     # 誘発待ち行列へ積まれ、押し出し確定後に消化される。
     gm._enforce_field_limit(owner)
     if not target.is_effect_negated:
-        for ability in target.master.abilities:
-            if ability.trigger == TriggerType.ON_PLAY:
-                # 中断中（押し出し選択、または先行して解決した登場時効果の選択待ち）は
-                # 即時解決できない（resolver._process_stack が中断中は1ステップも実行せず
-                # return するため、能力が無言で消える）。複数体同時登場（センゴク OP16-060
-                # 等）で2体目以降の【登場時】が消失していた根因。中断中は誘発待ち行列へ
-                # 積み、対話完了時に resolve_interaction / アクション境界が消化する。
-                if gm.active_interaction:
-                    gm._enqueue_trigger(owner, ability, target, optional=False)
-                else:
-                    gm.resolve_ability(owner, ability, source_card=target)
+        for ability in target.master.abilities_by_trigger.get(TriggerType.ON_PLAY, ()):
+            # 中断中（押し出し選択、または先行して解決した登場時効果の選択待ち）は
+            # 即時解決できない（resolver._process_stack が中断中は1ステップも実行せず
+            # return するため、能力が無言で消える）。複数体同時登場（センゴク OP16-060
+            # 等）で2体目以降の【登場時】が消失していた根因。中断中は誘発待ち行列へ
+            # 積み、対話完了時に resolve_interaction / アクション境界が消化する。
+            if gm.active_interaction:
+                gm._enqueue_trigger(owner, ability, target, optional=False)
+            else:
+                gm.resolve_ability(owner, ability, source_card=target)
     # 他カードの「…が登場した時」リスナー（OP14-041 等）。出所ゾーンは移動前の source_list
     # から判定する（「トラッシュから登場した時」OP16-079 等の出所限定フィルタ用）。
     _from_zone = ("HAND" if source_list is getattr(owner, "hand", None)
@@ -298,8 +302,7 @@ def face_up_life(gm, player, action, target, owner, source_list, value, source_c
 def grant_keyword(gm, player, action, target, owner, source_list, value, source_card):
     keyword = action.status
     if not keyword and getattr(action, 'raw_text', ''):
-        import unicodedata as _ud
-        _kw = re.search(r'【([^】]+)】', _ud.normalize('NFC', action.raw_text))
+        _kw = _KEYWORD_BRACKET_RE.search(_nfc(action.raw_text))
         if _kw:
             keyword = _kw.group(1)
     if keyword:
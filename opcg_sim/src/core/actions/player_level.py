@@ -3,7 +3,6 @@
 いずれも旧 `apply_action_to_engine` 冒頭の `if act_name == "X": ...; return` 分岐を逐語移設したもの。
 `self` を第1引数 `gm`（GameManager）へ読み替えただけで、挙動・戻り値は不変。
 """
-import random
 from ...models.enums import ActionType, Zone, TriggerType
 from ..rules_constants import SELF_RESTRICTION_KEYS
 from .registry import game_handler
@@ -48,7 +47,7 @@ def deal_damage(gm, player, action, targets, value, source_card):
     for _ in range(n):
         if damaged.life:
             life_card = damaged.life.pop(0)
-            trig = next((a for a in life_card.master.abilities if a.trigger == TriggerType.TRIGGER), None)
+            trig = next(iter(life_card.master.abilities_by_trigger.get(TriggerType.TRIGGER, ())), None)
             gm.move_card(life_card, Zone.HAND, damaged)
             life_lost += 1
             # 【トリガー】は任意。確認付きで待ち行列へ積む（即時解決しない）。
@@ -70,7 +69,7 @@ def shuffle(gm, player, action, targets, value, source_card):
     if action.target and getattr(action.target, 'player', None) is not None:
         if getattr(action.target.player, 'name', '') == 'OPPONENT':
             target_player = gm.p2 if player == gm.p1 else gm.p1
-    random.shuffle(target_player.deck)
+    target_player.shuffle_deck(gm.rng)
     return True
 
 
@@ -82,12 +81,8 @@ def look(gm, player, action, targets, value, source_card):
         opp = gm.p2 if player == gm.p1 else gm.p1
         count = min(value if value else 1, len(opp.deck))
         return True
-    count = value
-    deck = player.deck
-    if len(deck) < count: count = len(deck)
-    for _ in range(count):
-        card = deck.pop(0)
-        player.temp_zone.append(card)
+    # 上から value 枚（デッキが尽きればあるだけ）を順序どおり temp_zone へ一括で移す。
+    player._deal_from_deck(player.temp_zone, value)
     return True
 
 
@@ -100,15 +95,18 @@ def look_life(gm, player, action, targets, value, source_card):
     if getattr(action, "status", None) == "OPPONENT":
         target_player = gm.p2 if player == gm.p1 else gm.p1
     count = value if value else 1
-    moved = 0
-    for _ in range(count):
-        if not target_player.life:
-            break
-        card_ = target_player.life.pop(0)
+    if count <= 0:
+        return True
+    life = target_player.life
+    # ライフの上から count 枚を temp_zone へ。
+    revealed = life[:count]
+    if not revealed:
+        return True
+    del life[:count]
+    for card_ in revealed:
         # 不発時の回収先を記録する（temp 回収はデッキトップではなくライフ上へ戻す）
         card_._temp_origin = "LIFE"
-        target_player.temp_zone.append(card_)
-        moved += 1
+    target_player.temp_zone.extend(revealed)
     return True
 
 
@@ -127,7 +125,7 @@ def move_attached_don(gm, player, action, targets, value, source_card):
         don.is_rest = True
         player.don_rested.append(don)
         if tgt_uuid:
-            tgt = next((c for c in ([player.leader] + player.field) if c and c.uuid == tgt_uuid), None)
+            tgt = next((c for c in player.iter_units() if c.uuid == tgt_uuid), None)
             if tgt is not None and getattr(tgt, "attached_don", 0) > 0:
                 tgt.attached_don -= 1
         moved += 1
@@ -213,9 +211,7 @@ def select(gm, player, action, targets, value, source_card):
 
 @game_handler(ActionType.HEAL, ActionType.LIFE_RECOVER)
 def heal(gm, player, action, targets, value, source_card):
-    for _ in range(value):
-        if player.deck:
-            player.life.append(player.deck.pop(0))
+    player._deal_from_deck(player.life, value)
     return True
 
 
@@ -226,12 +222,7 @@ def trash_from_deck(gm, player, action, targets, value, source_card):
     target_player = player
     if getattr(action, "status", None) == "OPPONENT":
         target_player = gm.p2 if player == gm.p1 else gm.p1
-    milled = 0
-    for _ in range(value):
-        if not target_player.deck:
-            break
-        target_player.trash.append(target_player.deck.pop(0))
-        milled += 1
+    target_player._deal_from_deck(target_player.trash, value)
     return True
 
 
@@ -254,14 +245,12 @@ def swap_power(gm, player, action, targets, value, source_card):
 def ramp_don(gm, player, action, targets, value, source_card):
     # status=="RESTED" の場合はレスト状態でコストエリアへ（「レストで追加」）。
     add_rested = getattr(action, "status", None) == "RESTED"
-    for _ in range(value):
-        if player.don_deck:
-            don = player.don_deck.pop(0)
+    added = player.don_deck[:value] if value > 0 else []
+    if added:
+        del player.don_deck[:value]
+        for don in added:
             don.is_rest = add_rested
-            if add_rested:
-                player.don_rested.append(don)
-            else:
-                player.don_active.append(don)
+        (player.don_rested if add_rested else player.don_active).extend(added)
     return True
 
 
@@ -304,14 +293,13 @@ def rest_don(gm, player, action, targets, value, source_card):
     # 「ドン!!N枚をレストにする」/【ドン!!×N】コスト: アクティブ→レスト。
     # ドンは均質なため枚数(value)ベースで処理する。
     tp = gm._don_pool_player(player, action)
-    rested = 0
-    for _ in range(value):
-        if not tp.don_active:
-            break
-        don = tp.don_active.pop(0)
-        don.is_rest = True
-        tp.don_rested.append(don)
-        rested += 1
+    moved = tp.don_active[:value] if value > 0 else []
+    if moved:
+        del tp.don_active[:value]
+        for don in moved:
+            don.is_rest = True
+        tp.don_rested.extend(moved)
+    rested = len(moved)
     # 「レストにしたドン!!1枚につき…」(§7-5) 用に実レスト枚数を記録する。ドンは targets を
     # 介さず枚数処理するため、resolver の len(targets) では 0 になる（OP13-001）。
     gm._last_resource_count = rested
@@ -18,7 +18,7 @@ def run_target_loop(gm, player, action, atype, targets, value, source_card) -> b
     handler = _TARGET_HANDLERS.get(atype)   # None でもループは回す（旧 no-op 挙動）
     # 初期値 True: 対象0枚でも「何もしないことに成功した」とみなす（旧 success 規約）。
     success = True
-    for target in targets:
+    for i, target in enumerate(targets):
         owner, source_list = gm._find_card_location(target)
         if not owner:
             continue
@@ -34,7 +34,7 @@ def run_target_loop(gm, player, action, atype, targets, value, source_card) -> b
             # deferred フレームへ退避してループを抜ける（内側中断の解決後に再開する）。
             if gm._active_replacement(target, guard_statuses, can_suspend=True):
                 if gm.active_interaction is not None:
-                    remaining = targets[targets.index(target) + 1:]
+                    remaining = targets[i + 1:]
                     if remaining:
                         gm._defer_removal_targets(player, action, remaining, value)
                     return success
@@ -34,6 +34,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import re
 
 from ..models.enums import TriggerType
+from ..models.models import CONST
 from . import journal
 from .journal import JournaledList
 
@@ -451,10 +452,15 @@ def evaluate_base(manager, me_name: str, see_opp_hand: bool = True,
     return cpu_eval_v2.evaluate_v2(manager, me_name, see_opp_hand=see_opp_hand, out=out)
 
 
-def _pending_keys():
-    from . import action_api
-    pending_props = action_api.CONST.get('PENDING_REQUEST_PROPERTIES', {})
-    return pending_props.get('PLAYER_ID', 'player_id'), pending_props.get('ACTION', 'action')
+# 保留リクエストのキー名／戦闘 PASS 名は探索ノードごとに引くため、CONST の入れ子 get を
+# 呼び出しのたびに辿らずモジュール読み込み時に1度だけ解決する（interaction の _KEY_* と同じ方式）。
+_PENDING_PROPS = CONST.get('PENDING_REQUEST_PROPERTIES', {})
+_KEY_PID = _PENDING_PROPS.get('PLAYER_ID', 'player_id')
+_KEY_ACTION = _PENDING_PROPS.get('ACTION', 'action')
+_KEY_UUIDS = _PENDING_PROPS.get('SELECTABLE_UUIDS', 'selectable_uuids')
+_KEY_CONSTRAINTS = _PENDING_PROPS.get('CONSTRAINTS', 'constraints')
+_KEY_SKIP = _PENDING_PROPS.get('CAN_SKIP', 'can_skip')
+_BACT_PASS = CONST.get('c_to_s_interface', {}).get('BATTLE_ACTIONS', {}).get('TYPES', {}).get('PASS', 'PASS')
 
 
 # 効果対象選択（KO/除去/バウンス/手札破壊/場溢れトラッシュ等）の対話アクション名。
@@ -645,16 +651,11 @@ def _selection_moves(manager, actor_name: str):
     pending = manager.get_pending_request(with_request_id=False)
     if not pending:
         return None
-    KEY_PID, KEY_ACTION = _pending_keys()
-    if pending.get(KEY_PID) != actor_name:
+    if pending.get(_KEY_PID) != actor_name:
         return None
-    props = action_api.CONST.get('PENDING_REQUEST_PROPERTIES', {})
-    KEY_UUIDS = props.get('SELECTABLE_UUIDS', 'selectable_uuids')
-    KEY_CONSTRAINTS = props.get('CONSTRAINTS', 'constraints')
-    KEY_SKIP = props.get('CAN_SKIP', 'can_skip')
 
     # 任意確認（任意コスト/任意効果の発動可否）: accept(発動) / decline(見送り) を採点させる。
-    if pending.get(KEY_ACTION) == "CONFIRM_OPTIONAL" and bool(pending.get(KEY_SKIP, False)):
+    if pending.get(_KEY_ACTION) == "CONFIRM_OPTIONAL" and bool(pending.get(_KEY_SKIP, False)):
         base = manager.default_interaction_payload(pending)
         accept = dict(base); accept["accepted"] = True
         decline = dict(base); decline["accepted"] = False
@@ -666,8 +667,8 @@ def _selection_moves(manager, actor_name: str):
     # 回転 × 上/下（allow_position 時）だけを候補化する。返り値は**既定解決を含む完全な集合**
     # （L1 経路は本関数の返りで合法手を置換するため）。既定の組は base と同一 payload にする＝
     # merged_search_actions のキー重複除去で二重 edge にならない（訪問数を分裂させない）。
-    if pending.get(KEY_ACTION) == "ARRANGE_DECK":
-        uuids = list(pending.get(KEY_UUIDS, []) or [])
+    if pending.get(_KEY_ACTION) == "ARRANGE_DECK":
+        uuids = list(pending.get(_KEY_UUIDS, []) or [])
         allow_pos = bool(pending.get("allow_position", False))
         allow_reorder = bool(pending.get("allow_reorder", False))
         if not uuids or not (allow_pos or (allow_reorder and len(uuids) >= 2)):
@@ -691,10 +692,10 @@ def _selection_moves(manager, actor_name: str):
         moves = [_mk_arr(o, p) for o in orders for p in positions]
         return moves if len(moves) >= 2 else None
 
-    if pending.get(KEY_ACTION) != _SELECT_ACTION:
+    if pending.get(_KEY_ACTION) != _SELECT_ACTION:
         return None
-    uuids = list(pending.get(KEY_UUIDS, []) or [])
-    constraints = pending.get(KEY_CONSTRAINTS) or {}
+    uuids = list(pending.get(_KEY_UUIDS, []) or [])
+    constraints = pending.get(_KEY_CONSTRAINTS) or {}
     try:
         min_n = int(constraints.get("min", 0))
     except (TypeError, ValueError):
@@ -716,7 +717,7 @@ def _selection_moves(manager, actor_name: str):
     if max_n == 1 and min_n <= 1:
         moves: List[Dict[str, Any]] = [_mk([uid]) for uid in uuids[:HARD_SELECT_CAP]]
         # 任意選択（min==0・スキップ可）なら「選ばない」も一級の候補にする。
-        if min_n == 0 and bool(pending.get(KEY_SKIP, False)):
+        if min_n == 0 and bool(pending.get(_KEY_SKIP, False)):
             moves.append(_mk([]))
         return moves
 
@@ -795,9 +796,6 @@ def _settle_eval(manager, root_name: str, see_opp_hand: bool, ply: int = 0) -> f
     相手の MAIN_ACTION に到達したら停止（＝相手ターン開始の静止点）。`manager` はクローンなので破壊的に進めてよい。
     """
     from . import action_api
-    KEY_PID, KEY_ACTION = _pending_keys()
-    battle_actions = action_api.CONST.get('c_to_s_interface', {}).get('BATTLE_ACTIONS', {}).get('TYPES', {})
-    ACT_PASS = battle_actions.get('PASS', 'PASS')
     for _ in range(_SETTLE_LIMIT):
         if manager.winner is not None:
             break
@@ -814,7 +812,7 @@ def _settle_eval(manager, root_name: str, see_opp_hand: bool, ply: int = 0) -> f
             if action == "MAIN_ACTION":              # root の手番 → ターンを畳む
                 action_api.apply_game_action(manager, actor, "TURN_END", {})
             elif action in ("SELECT_BLOCKER", "SELECT_COUNTER"):  # 戦闘応答 → 既定パスで解決
-                action_api.apply_battle_action(manager, actor, ACT_PASS, None)
+                action_api.apply_battle_action(manager, actor, _BACT_PASS, None)
             else:                                     # その他の選択 → 既定解決
                 pending = manager.get_pending_request(with_request_id=False)  # 既定解決時のみフル payload
                 payload = manager.default_interaction_payload(pending)
@@ -1294,7 +1292,6 @@ def _read_ahead_line(manager, root_name: str, see_opp_hand: bool, opp_public_onl
     """
     line: List[Dict[str, Any]] = []
     cur = manager
-    KEY_PID, KEY_ACTION = _pending_keys()
     # 繰り返しガードは不要（起動メインはエンジンの正規ゲートで自己制限・REPEAT_CAP 撤去済み）。
     # PV は `max_steps` で有界。
     for _ in range(max_steps):
@@ -15,8 +15,13 @@
   この一箇所にのみ置く。非リーサルのオーバーステイ抑止は探索の相手モデル担当＝静的には入れない。
 - キーワード固有の静的重みは持たない（ブロッカーは Tele の控除としてのみ作用）。L2 は別途・本ファイル対象外。
 """
+import math
 from typing import Any, Dict, Optional
 
+# cpu_ai は cpu_eval_v2 を関数内でだけ import する（モジュール読み込み時の循環は無い）ため、
+# しきい値・補助関数はここで1度だけ束縛し、評価のたびの import（sys.modules 引き）を避ける。
+from .cpu_ai import DECK_DANGER, W_WIN, _effective_power, _other, _player_by_name, _power_cap
+
 # ───────────────────────── 係数（first calibration・未SPSA） ─────────────────────────
 # 単位＝カード1枚。データ（life_diff 支配・+0.87）に合わせ**ライフを支配項**にする。最終確定は SPSA（§9）。
 # ライフは「単調増加・凹型」（薄いほど 1 枚が precious）＝ダメージレースの駆動源。
@@ -62,7 +67,6 @@ def _life_value(p) -> float:
     L = len(p.life)
     near = min(L, V2_LIFE_KNEE)               # 薄域＝precious
     far = max(0, L - V2_LIFE_KNEE)            # 厚域＝安い
-    from .cpu_ai import DECK_DANGER           # 既存のしきい値を流用（遅延 import で循環回避）
     deck_danger = max(0, DECK_DANGER - len(p.deck))
     return near * V2_W_LIFE_PRECIOUS + far * V2_W_LIFE_HIGH - V2_W_DECK * deck_danger
 
@@ -73,7 +77,6 @@ def _clock_of(p, opp, is_turn: bool) -> float:
     防御控除（相手ブロッカー吸収・相手の期待カウンター緩衝）は Tele 側でのみ行う（§4.2）。ここでは
     生の攻め圧（攻撃できる体の有効パワーの和 / 1000）を返す。
     """
-    from .cpu_ai import _power_cap, _effective_power
     cap = _power_cap(opp)
     reach = 0.0
     for c in p.field:
@@ -178,7 +181,6 @@ def evaluate_v2(manager, me_name: str, see_opp_hand: bool = True,
 
     first cut＝構造は v0.4 に忠実・係数は未チューニング。CPU 評価はこの L1 単一系統。
     """
-    from .cpu_ai import _player_by_name, _other, W_WIN
     if manager.winner == me_name:
         return W_WIN
     if manager.winner is not None:
@@ -232,5 +234,4 @@ def _decay(pressure: float) -> float:
     first cut: 圧力が高すぎる（守り切れない）領域でロジスティック的に頭打ち＆減衰。
     """
     # pressure ~1 付近で増幅最大、それ以上（守り切れない）では緩やかに減衰させる逆U字。
-    import math
     return pressure * math.exp(-max(0.0, pressure - 1.0))
@@ -19,6 +19,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
+from .. import journal
 from ..journal import JournaledList
 
 # Duration 定数
@@ -32,7 +33,11 @@ EV_TURN_END = "TURN_END"
 EV_BATTLE_END = "BATTLE_END"
 
 
-@dataclass
+# slots=True: 付与のたびに生成される小さな値オブジェクトのため __dict__ を持たせない
+# （生成・属性参照が軽く、effects が膨らんでもメモリを食わない）。属性は生成後に書き換えない
+# ので journal の record_attr は不要で、deep_diff も dataclass の == 比較で足りる。
+# Player/GameManager/CardInstance は __setattr__ で __dict__ を journal に記録するため対象外。
+@dataclass(slots=True)
 class ContinuousEffect:
     target_uuid: str
     kind: str          # "POWER" | "COST" | "FLAG" | "KEYWORD"
@@ -46,7 +51,6 @@ class ContinuousEffect:
 class ContinuousEffectManager:
     def __setattr__(self, name, value):
         # 差分巻き戻し（journal.transaction 中のみ記録）。effects の付け替えを巻き戻すため。
-        from .. import journal
         if journal._TL.active is not None:
             journal.record_attr(self, name, self.__dict__)
         object.__setattr__(self, name, value)
@@ -595,8 +595,8 @@ def get_target_cards(game_manager, query: TargetQuery, source_card) -> list:
                 # トリガー所持なら通す（OP05-002）。それ以外は従来どおり除外。
                 if "TRAIT_OR_TRIGGER" not in query.flags:
                     continue
-                _trig = bool(getattr(card.master, "trigger_text", "")) or any(
-                    ab.trigger == TriggerType.TRIGGER for ab in getattr(card.master, "abilities", ()))
+                _trig = (bool(getattr(card.master, "trigger_text", ""))
+                         or TriggerType.TRIGGER in card.master.abilities_by_trigger)
                 if not _trig:
                     continue
         if query.is_rest is not None and card.is_rest != query.is_rest: continue
@@ -605,8 +605,8 @@ def get_target_cards(game_manager, query: TargetQuery, source_card) -> list:
         # TriggerType.TRIGGER 能力）を持つカードのみに限定する（OP16-080 等）。
         # TRAIT_OR_TRIGGER（特徴 OR トリガー）の場合は上の特徴フィルタで OR 判定済みのため除外。
         if "HAS_TRIGGER" in query.flags and "TRAIT_OR_TRIGGER" not in query.flags:
-            has_trig = bool(getattr(card.master, "trigger_text", "")) or any(
-                ab.trigger == TriggerType.TRIGGER for ab in getattr(card.master, "abilities", ()))
+            has_trig = (bool(getattr(card.master, "trigger_text", ""))
+                        or TriggerType.TRIGGER in card.master.abilities_by_trigger)
             if not has_trig:
                 continue
         
@@ -10,11 +10,23 @@ import re
 import logging
 from .. import journal
 from ..journal import JournaledList, JournaledDict, JournaledSet, record_attr
+# 対象の実体化は効果解決の随所で呼ぶため、関数内 import（呼び出しごとの import 機構の
+# 参照）ではなくモジュール読み込み時に1回だけ束縛する（matcher は resolver を import しない）。
+from .matcher import get_target_cards
 
 # 効果解決のデバッグスナップショット（EXECUTION_REPORT/DEBUG_SNAPSHOT）用ロガー。
 # OPCG_LOG_SILENT=1 のとき logging_setup が opcg.* を抑止する（従来の print ゲートと同一挙動）。
 _debug_logger = logging.getLogger("opcg.debug")
 
+
+def _debug_reports_enabled() -> bool:
+    """実行レポート/失敗スナップショットを組み立てる価値があるか。
+    get_debug_snapshot() と json.dumps は盤面全体を辿って重いので、`opcg.debug` が DEBUG を
+    捨てる設定（サイレント・探索中にレベルを上げた場合等）なら組み立て前に打ち切る。
+    isEnabledFor はロガー側でキャッシュされるため毎回の判定は安い。"""
+    return _debug_logger.isEnabledFor(logging.DEBUG) and not os.environ.get("OPCG_LOG_SILENT")
+
+
 # 選択グループ分配（§7-1）で「N枚を選び」の選択集合を保存する save_id。
 # atoms._SEL_GROUP_ID と一致させる。
 _SEL_GROUP_ID = "_sel_group"
@@ -49,7 +61,9 @@ class EffectResolver:
     def resolve_ability(self, player, ability, source_card, cost_confirmed=False):
         # 1. 条件チェック
         if ability.condition and not self._check_condition(player, ability.condition, source_card):
-            self._log_failure_snapshot(player, source_card, ability, "CONDITION_MISMATCH", f"Condition type: {ability.condition.type.name}")
+            # 詳細文字列（f-string）は出力される時だけ組む。条件不成立は探索中に頻発する。
+            if _debug_reports_enabled():
+                self._log_failure_snapshot(player, source_card, ability, "CONDITION_MISMATCH", f"Condition type: {ability.condition.type.name}")
             return
 
         # 1.5 使用回数制限（【ターン1回】等）の enforce。
@@ -63,7 +77,8 @@ class EffectResolver:
             limit_key = self._ability_key(source_card, ability)
             used_count = source_card.ability_used_this_turn.get(limit_key, 0)
             if used_count >= turn_limit:
-                self._log_failure_snapshot(player, source_card, ability, "TURN_LIMIT_REACHED", f"Used {used_count}/{turn_limit} this turn")
+                if _debug_reports_enabled():
+                    self._log_failure_snapshot(player, source_card, ability, "TURN_LIMIT_REACHED", f"Used {used_count}/{turn_limit} this turn")
                 return
 
         # 2. コストチェック
@@ -71,7 +86,8 @@ class EffectResolver:
         #   能力が発生しないだけで、例外にはしない（旧実装は raise していたため、任意コストを
         #   払えない ON_PLAY 等を持つカードを出すとゲームが落ちていた）。
         if ability.cost and not self._can_satisfy_node(player, ability.cost, source_card):
-            self._log_failure_snapshot(player, source_card, ability, "COST_UNSATISFIED", "Insufficient resources or targets for cost")
+            if _debug_reports_enabled():
+                self._log_failure_snapshot(player, source_card, ability, "COST_UNSATISFIED", "Insufficient resources or targets for cost")
             return
 
         # 2.5 コストの使用確認（A-3）。OPCG ではコスト句（「X：Y」の X）の支払いは常に任意
@@ -107,7 +123,7 @@ class EffectResolver:
         self._process_stack(player, source_card)
         
         # ▼▼▼ 追加: 処理完了時にレポートを出力（中断されていなければ） ▼▼▼
-        if not self.game_manager.active_interaction:
+        if _debug_reports_enabled() and not self.game_manager.active_interaction:
             self._log_execution_report(player, source_card, ability)
 
     def _turn_limit_of(self, condition):
@@ -134,7 +150,7 @@ class EffectResolver:
 
     def _log_execution_report(self, player, source_card, ability):
         """効果処理の結果（何をしてどうなったか）をまとめて出力する。"""
-        if os.environ.get("OPCG_LOG_SILENT"):
+        if not _debug_reports_enabled():
             return
         try:
             snapshot = self.game_manager.get_debug_snapshot()
@@ -156,7 +172,7 @@ class EffectResolver:
             _debug_logger.debug("Report generation failed", exc_info=True)
 
     def _log_failure_snapshot(self, player, source_card, ability, error_code, detail_msg):
-        if os.environ.get("OPCG_LOG_SILENT"):
+        if not _debug_reports_enabled():
             return
         try:
             snapshot = self.game_manager.get_debug_snapshot()
@@ -193,7 +209,6 @@ class EffectResolver:
                          + len(player.don_attached_cards))
                 return total >= cost
             if not node.target: return True
-            from .matcher import get_target_cards
             candidates = get_target_cards(self.game_manager, node.target, source_card)
             # ref_id='self'（「このキャラ」等）は解決時に source へ限定される（resolver._resolve_targets）。
             # 充足判定も同じく source 限定にする。これをしないと、レスト済み source でも他のアクティブ
@@ -342,17 +357,14 @@ class EffectResolver:
             "ACTIVATE_MAIN": TriggerType.ACTIVATE_MAIN,
         }
         primary = ref_map.get(ref_trigger, TriggerType.ACTIVATE_MAIN)
-        main_abilities = [
-            ab for ab in source_card.master.abilities
-            if ab.trigger == primary and ab.effect is not None
-        ]
+        by_trigger = source_card.master.abilities_by_trigger
+        main_abilities = [ab for ab in by_trigger.get(primary, ()) if ab.effect is not None]
         # 【トリガー】(ライフ公開時に発動)は ACTIVATE_MAIN だけでなく、効果が【カウンター】に
         # 書かれたイベント(例: OP01-028/OP13-039)も発動対象。参照先能力が無ければ
         # COUNTER 能力にフォールバックする（従来は ACTIVATE_MAIN 限定で何も発動しなかった）。
         if not main_abilities:
             main_abilities = [
-                ab for ab in source_card.master.abilities
-                if ab.trigger == TriggerType.COUNTER and ab.effect is not None
+                ab for ab in by_trigger.get(TriggerType.COUNTER, ()) if ab.effect is not None
             ]
         if not main_abilities:
             return
@@ -378,11 +390,11 @@ class EffectResolver:
         }
         primary = ref_map.get(ref_trigger, TriggerType.ACTIVATE_MAIN)
         for card in cards:
-            mains = [ab for ab in card.master.abilities
-                     if ab.trigger == primary and ab.effect is not None]
+            by_trigger = card.master.abilities_by_trigger
+            mains = [ab for ab in by_trigger.get(primary, ()) if ab.effect is not None]
             if not mains:
-                mains = [ab for ab in card.master.abilities
-                         if ab.trigger == TriggerType.COUNTER and ab.effect is not None]
+                mains = [ab for ab in by_trigger.get(TriggerType.COUNTER, ())
+                         if ab.effect is not None]
             if not mains:
                 continue
             for ab in mains:
@@ -569,8 +581,6 @@ class EffectResolver:
                 consumed = self.context.setdefault("_grp_consumed", JournaledDict()).setdefault(_SEL_GROUP_ID, JournaledList())
                 return [c for c in group if c.uuid not in consumed]
 
-        from .matcher import get_target_cards
-
         # 「お互いの〜」(BOTH_SIDES): 両プレイヤーへ独立・同時に適用する。各サイドで候補・枚数を
         # 個別に解決し結合する。選択を伴うサイド（候補>必要枚数の手札捨て等。OP05-058）は、その
         # サイドのプレイヤーに**順に選ばせる**（相手→自分の順で SELECT_TARGET 中断）。選択の余地が
@@ -776,7 +786,6 @@ class EffectResolver:
             # 盤面のキャラ枚数条件。target にフィルタ（レスト/特徴/コスト/プレイヤー）が
             # あれば matcher で実体化して数える。無ければ場全体の枚数。
             if condition.target is not None:
-                from .matcher import get_target_cards
                 current_val = len(get_target_cards(self.game_manager, condition.target, source_card))
             else:
                 current_val = len(target_player.field) + (1 if target_player.stage else 0)
@@ -878,7 +887,6 @@ class EffectResolver:
             return False
             
         elif condition.type in [ConditionType.HAS_TRAIT, ConditionType.HAS_ATTRIBUTE, ConditionType.HAS_UNIT]:
-            from .matcher import get_target_cards
             query = condition.target
             if not query:
                 query = TargetQuery(zone=Zone.FIELD, player=condition.player)
@@ -1093,7 +1101,6 @@ class EffectResolver:
                 return False
             # カードタイプチェック
             if "card_type" in val:
-                from ...models.enums import CardType
                 type_map = {
                     "キャラ": CardType.CHARACTER,
                     "イベント": CardType.EVENT,
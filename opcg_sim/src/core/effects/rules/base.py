@@ -13,20 +13,14 @@
 """
 from __future__ import annotations
 
-import unicodedata
 from dataclasses import dataclass, field
 from typing import Callable, List, Optional
 
-from ....models.effect_types import EffectNode
+from ....models.effect_types import EffectNode, _nfc  # _nfc はルール各モジュールも base から使う
 
 
-def _nfc(text: str) -> str:
-    if not text:
-        return ""
-    return unicodedata.normalize("NFC", text)
-
-
-@dataclass
+# 原子句1つごとに生成されて解析後に捨てる短命のオブジェクトなので slots=True。
+@dataclass(slots=True)
 class ParseContext:
     """1つの原子句を解析するための入力。
 
@@ -43,7 +37,7 @@ class ParseContext:
         self.text = _nfc(self.text)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     node: EffectNode
     rule_name: str
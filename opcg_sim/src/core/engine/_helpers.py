@@ -1,17 +1,13 @@
 """エンジン層の葉ヘルパ（NFC 正規化・ターン制限判定・能力インデックス）。
 
-gamestate.py と engine/* の双方から使う純粋関数。依存は stdlib + models.enums のみ
+gamestate.py と engine/* の双方から使う純粋関数。依存は stdlib + models.enums/effect_types のみ
 （循環回避のための葉モジュール）。gamestate.py はこれらを後方互換で再エクスポートする。
 """
 import re
-import unicodedata
 from typing import Optional, Any
 
 from ...models.enums import ConditionType
-
-
-def _nfc(text: str) -> str:
-    return unicodedata.normalize('NFC', text)
+from ...models.effect_types import _nfc  # noqa: F401  (engine/* と gamestate が共有する NFC 正規化)
 
 
 # 【ターン1回】系の表記（置換/保護能力は parser が TURN_LIMIT 条件を落とすため raw_text からも拾う）。
@@ -41,8 +41,10 @@ def declare_attack(gm, attacker: Card, target: Card):
             raise ValueError(f"アタックするには手札{need}枚を捨てる必要があり、手札が足りません。")
         # コスト支払い: 手札N枚を捨てる。どの札を捨てるかは本来プレイヤー選択だが、宣言経路を
         # 中断させないため先頭からN枚を捨てる（捨て札選択の対話化は今後の課題）。
-        for _ in range(need):
-            attacker_owner.trash.append(attacker_owner.hand.pop(0))
+        hand = attacker_owner.hand
+        discarded = hand[:need]
+        del hand[:need]
+        attacker_owner.trash.extend(discarded)
     attacker.is_rest = True
     gm.active_battle = JournaledDict({"attacker": attacker, "target": target, "attacker_owner": attacker_owner, "target_owner": target_owner, "counter_buff": 0})
 
@@ -62,11 +64,9 @@ def declare_attack(gm, attacker: Card, target: Card):
                   and gm._rest_subject_matches(ability, attacker, attacker,
                                                  attacker_owner, by_attack=True)):
                 triggers.append((attacker_owner, ability, attacker))
-    opp_cards = ([target_owner.leader] if target_owner.leader else []) + target_owner.field
-    for card in opp_cards:
-        for ability in card.master.abilities:
-            if ability.trigger == TriggerType.ON_OPP_ATTACK:
-                triggers.append((target_owner, ability, card))
+    for card in target_owner.iter_units(include_stage=False):
+        for ability in card.master.abilities_by_trigger.get(TriggerType.ON_OPP_ATTACK, ()):
+            triggers.append((target_owner, ability, card))
     gm._battle_triggers = JournaledList(triggers)
     gm._advance_battle_triggers()
 
@@ -96,9 +96,8 @@ def handle_block(gm, blocker: Optional[Card] = None):
         gm.active_battle["target"] = blocker
         # 【ブロック時】効果を発動する（従来は未発火＝14枚が no-op だった）。
         if blocker.master.abilities and not blocker.is_effect_negated and not blocker.negated:
-            for ability in blocker.master.abilities:
-                if ability.trigger == TriggerType.ON_BLOCK:
-                    gm.resolve_ability(target_owner, ability, source_card=blocker)
+            for ability in blocker.master.abilities_by_trigger.get(TriggerType.ON_BLOCK, ()):
+                gm.resolve_ability(target_owner, ability, source_card=blocker)
         if gm.active_interaction:
             # ブロック時効果が対象選択等で中断した場合はここで返す（resume が継続）。
             return
@@ -110,8 +109,8 @@ def apply_counter(gm, player: Player, counter_card: Optional[Card] = None, don_l
     gm._validate_action(player, "SELECT_COUNTER")
     if counter_card.master.type == CardType.EVENT:
         gm.pay_cost(player, counter_card.master.cost, don_list)
-        for ability in counter_card.master.abilities:
-            if ability.trigger == TriggerType.COUNTER: gm.resolve_ability(player, ability, source_card=counter_card)
+        for ability in counter_card.master.abilities_by_trigger.get(TriggerType.COUNTER, ()):
+            gm.resolve_ability(player, ability, source_card=counter_card)
         # 「自分のキャラすべては、このターン中、…代わりに〜できる」(EB02-030) のような
         # 継続付与型の置換を登録する。イベントは即トラッシュで場に残らないため、
         # _find_replacement の場上 protector 走査では拾えない。player へ this-turn 付与する。
@@ -122,22 +121,26 @@ def apply_counter(gm, player: Player, counter_card: Optional[Card] = None, don_l
         gm.move_card(counter_card, Zone.TRASH, player)
 
 def resolve_attack(gm):
-    if not gm.active_battle: return
-    attacker = gm.active_battle["attacker"]; target = gm.active_battle["target"]
-    attacker_owner = gm.active_battle["attacker_owner"]; target_owner = gm.active_battle["target_owner"]
-    counter_buff = gm.active_battle.get("counter_buff", 0)
+    battle = gm.active_battle
+    if not battle: return
+    # active_battle は JournaledDict（make/unmake で巻き戻す・API スキーマ/テストも dict 前提）のまま、
+    # 参照は冒頭でローカルへ一度だけ取り出す。
+    attacker = battle["attacker"]; target = battle["target"]
+    attacker_owner = battle["attacker_owner"]; target_owner = battle["target_owner"]
+    counter_buff = battle.get("counter_buff", 0)
     is_my_turn = (attacker_owner == gm.turn_player); is_target_turn = (target_owner == gm.turn_player)
     attacker_pwr = attacker.get_power(is_my_turn); target_pwr = target.get_power(is_target_turn) + counter_buff
     life_lost = 0
     if target == target_owner.leader:
         if attacker_pwr >= target_pwr:
             damage_amount = 2 if attacker.has_keyword("ダブルアタック") else 1; is_banish = attacker.has_keyword("バニッシュ")
+            # 移動先は攻撃者のキーワードだけで決まる（ループ不変）。
+            dest_zone = Zone.TRASH if is_banish else Zone.HAND
             for _ in range(damage_amount):
                 if target_owner.life:
                     life_card = target_owner.life.pop(0)
-                    dest_zone = Zone.TRASH if is_banish else Zone.HAND
                     trigger_ability = None if is_banish else next(
-                        (a for a in life_card.master.abilities if a.trigger == TriggerType.TRIGGER), None
+                        iter(life_card.master.abilities_by_trigger.get(TriggerType.TRIGGER, ())), None
                     )
                     gm.move_card(life_card, dest_zone, target_owner)
                     life_lost += 1
@@ -199,13 +202,18 @@ def _suspend_for_battle_ko_replacement(gm, target: Card, target_owner: Player, l
         },
     }
 
+def _can_block(card) -> bool:
+    """場のキャラが今【ブロッカー】を発動できるか。has_blocker（ブロックステップへ進むか）と
+    BLOCK_STEP の候補列挙が同じ判定を共有する。アクティブ・【ブロッカー】を持つ・
+    「【ブロッカー】を発動できない」(BLOCKER_DISABLED)・「レストにならない」(CANNOT_REST) でない。
+    ブロッカー集合をキャッシュしないのは、キーワード/フラグ/レストが効果・継続効果の再計算・
+    テストから直接書き換えられ、増分更新の同期点を保証できないため（場は高々5体）。"""
+    return (not card.is_rest and card.has_keyword("ブロッカー")
+            and "BLOCKER_DISABLED" not in card.flags
+            and "CANNOT_REST" not in card.timed_flags)
+
 def has_blocker(gm, player: Player) -> bool:
-    for card in player.field:
-        if (not card.is_rest and card.has_keyword("ブロッカー")
-                and "BLOCKER_DISABLED" not in card.flags
-                and "CANNOT_REST" not in card.timed_flags):
-            return True
-    return False
+    return any(_can_block(card) for card in player.field)
 
 def check_victory(gm):
     # デッキアウト: 通常は本人の敗北（相手の勝利）。ただし C10「自分のデッキが0枚に
@@ -218,15 +226,12 @@ def check_victory(gm):
 
 def _has_deckout_win_replace(gm, player) -> bool:
     """player がデッキアウト時の敗北→勝利の置換能力(PASSIVE)を持つか。"""
-    units = [player.leader] + list(player.field)
-    for card in units:
+    for card in (player.leader, *player.field):   # リーダーと場のキャラ（ステージは対象外）
         if not card or not getattr(card, "master", None) or getattr(card, "negated", False):
             continue
         if getattr(card, "is_effect_negated", False):
             continue
-        for ab in card.master.abilities:
-            if ab.trigger != TriggerType.PASSIVE:
-                continue
+        for ab in card.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
             eff = gm._find_action(ab.effect, ActionType.VICTORY)
             if eff is not None and eff.status == "REPLACE_DECKOUT_LOSS":
                 return True
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import re
+from operator import attrgetter
 
 from ..journal import JournaledList
 from ...models.models import DonInstance
@@ -9,6 +10,34 @@ from ...models.enums import Zone, CardType
 from ..rules_constants import FIELD_LIMIT
 from ._helpers import _nfc
 
+# move_card が毎回比較するカード種別（Enum メンバー参照は重いのでモジュール定数に束縛）。
+_TYPE_CHARACTER = CardType.CHARACTER
+_TYPE_STAGE = CardType.STAGE
+# 同じく移動先の判定に使うゾーン。毎回 [Zone.X, ...] の list を組んで線形比較していたのを、
+# モジュール定数の frozenset 所属判定（ハッシュ1回）に置き換える。
+_ZONE_FIELD = Zone.FIELD
+_ZONE_TRASH = Zone.TRASH
+_RESET_STATUS_ZONES = frozenset((Zone.TRASH, Zone.HAND))            # ターン状態・使用回数をリセット
+_CLEAR_REST_ZONES = frozenset((Zone.TRASH, Zone.HAND, Zone.DECK))   # レスト（横向き）を解除
+
+# 移動先ゾーン → プレイヤーのゾーン list の属性名。if/elif の連鎖（各分岐で Enum メンバーを
+# 引いて比較）を辞書1回の引きに置き換える。ステージ（FIELD かつ STAGE）は move_card 側で別扱い。
+_DEST_ZONE_ATTR = {
+    Zone.HAND: "hand",
+    Zone.FIELD: "field",
+    Zone.TRASH: "trash",
+    Zone.LIFE: "life",
+    Zone.DECK: "deck",
+    Zone.TEMP: "temp_zone",
+}
+
+# _find_card_location が全探索で見る領域の属性名。枚数が小さく移動元になりやすい順に並べ、
+# 最大のデッキは最後に回す。
+_CARD_ZONE_ATTRS = ("field", "hand", "life", "trash", "temp_zone", "deck")
+_DON_ZONE_ATTRS = ("don_active", "don_rested", "don_attached_cards")
+# _find_card_by_uuid の探索順（従来の候補 list の連結順）。
+_UUID_SEARCH_ZONES = attrgetter("hand", "field", "trash", "life", "deck", "temp_zone")
+
 
 def _apply_leader_don_deck_rule(gm, player: Player) -> None:
     """リーダーの「ルール上、自分のドン!!デッキはN枚になる」をドン!!デッキ枚数に反映する。
@@ -24,20 +53,29 @@ def _apply_leader_don_deck_rule(gm, player: Player) -> None:
     player.don_deck = JournaledList(DonInstance(owner_id=player.name) for _ in range(n))
 
 def _find_card_by_uuid(gm, uuid: str) -> Optional[CardInstance]:
-    all_players = [gm.p1, gm.p2]
-    for p in all_players:
-        candidates = []
-        if p.leader: candidates.append(p.leader)
-        if p.stage: candidates.append(p.stage)
-        candidates.extend(p.hand)
-        candidates.extend(p.field)
-        candidates.extend(p.trash)
-        candidates.extend(p.life)
-        candidates.extend(p.deck)
-        candidates.extend(p.temp_zone)
-        for c in candidates:
-            if c.uuid == uuid:
-                return c
+    # 所在ヒント（_find_card_location と共用）があれば、その1ゾーンだけを見る。ゾーンは直接
+    # 書き換えられ得るので、そこで見つからなければ下の全探索へ落ちる（結果は常に実際の所在）。
+    p1, p2 = gm.p1, gm.p2
+    hint = gm._loc_hint.get(uuid)
+    if hint is not None:
+        p, attr = hint
+        if p is p1 or p is p2:
+            if attr is None:
+                if p.leader and p.leader.uuid == uuid: return p.leader
+                if p.stage and p.stage.uuid == uuid: return p.stage
+            elif attr in _CARD_ZONE_ATTRS:   # ドン!!のヒントは対象外（下の全探索もドン領域は見ない）
+                for c in getattr(p, attr):
+                    if c.uuid == uuid:
+                        return c
+    # ゾーンを連結した候補 list を毎回作らず、各ゾーンをそのまま走査する（探索順は従来どおり
+    # p1 → p2、リーダー → ステージ → 手札 → 場 → トラッシュ → ライフ → デッキ → 一時領域）。
+    for p in (p1, p2):
+        if p.leader and p.leader.uuid == uuid: return p.leader
+        if p.stage and p.stage.uuid == uuid: return p.stage
+        for zone in _UUID_SEARCH_ZONES(p):
+            for c in zone:
+                if c.uuid == uuid:
+                    return c
     return None
 
 def _enforce_field_limit(gm, owner: Player) -> None:
@@ -65,21 +103,49 @@ def _suspend_for_field_overflow(gm, owner: Player) -> None:
     }
 
 def draw_card(gm, player: Player, count: int = 1):
-    for _ in range(count):
-        if player.deck:
-            card = player.deck.pop(0); player.hand.append(card)
+    # 上から count 枚（デッキが尽きればあるだけ）を手札へ。
+    hand = player.hand
+    before = len(hand)
+    player._deal_from_deck(hand, count)
+    # 引いたカードは次にプレイ/捨て札で move_card されることが多いので、所在ヒントを先に
+    # 入れておく（ヒントは検証付きなので、後で直接書き換えられても結果は変わらない）。
+    hints = gm._loc_hint
+    for c in hand[before:]:
+        hints[c.uuid] = (player, "hand")
     if not player.deck and not gm.winner: gm.check_victory()
 
+def _remember_location(gm, card: Card, player: Player, attr: Optional[str]) -> None:
+    """所在ヒント（uuid → (プレイヤー, ゾーン属性名)。attr=None はリーダー/ステージ）を記録する。"""
+    gm._loc_hint[card.uuid] = (player, attr)
+
 def _find_card_location(gm, card: Card) -> Tuple[Optional[Player], Optional[List[Any]]]:
-    for p in [gm.p1, gm.p2]:
-        zones = [
-            p.hand, p.field, p.life, p.trash, p.deck, p.temp_zone,
-            p.don_active, p.don_rested, p.don_attached_cards
-        ]
-        if p.leader == card: return p, None
-        if p.stage == card: return p, None
-        for zone in zones:
-            if card in zone: return p, zone
+    # 1) 所在ヒント（前回見つけた/移した場所）を先に検証する。ゾーン list は効果/テストから
+    #    直接 pop・del・差し替えされ得るため、ヒントは「そこにまだ居るか」を確かめてからだけ使う
+    #    （外れたら全探索へ落ちる＝結果は常に実際の所在）。検証は1ゾーンの `in` で済む。
+    p1, p2 = gm.p1, gm.p2
+    hint = gm._loc_hint.get(card.uuid)
+    if hint is not None:
+        p, attr = hint
+        if p is p1 or p is p2:
+            if attr is None:
+                if p.leader is card or p.stage is card: return p, None
+            else:
+                zone = getattr(p, attr)
+                if card in zone: return p, zone
+    # 2) 全探索。カード/ドン!!はほぼ常に持ち主（owner_id）の領域にあるため、持ち主側から探す。
+    #    見つからなければ相手側も探す（コントロール移動等）。
+    players = (p2, p1) if getattr(card, "owner_id", None) == p2.name else (p1, p2)
+    # ドン!!はドン領域にしか、カードはカード領域にしか置かれないので、種別で探す領域を絞る。
+    attrs = _DON_ZONE_ATTRS if isinstance(card, DonInstance) else _CARD_ZONE_ATTRS
+    for p in players:
+        if p.leader is card or p.stage is card:
+            _remember_location(gm, card, p, None)
+            return p, None
+        for attr in attrs:
+            zone = getattr(p, attr)
+            if card in zone:
+                _remember_location(gm, card, p, attr)
+                return p, zone
     return None, None
 
 def move_card(gm, card: Card, dest_zone: Zone, dest_player: Player, dest_position: str = "BOTTOM"):
@@ -87,22 +153,27 @@ def move_card(gm, card: Card, dest_zone: Zone, dest_player: Player, dest_positio
     
     # 領域移動時はステータスをリセット（特にトラッシュ/手札へ戻る場合）。
     # 場を離れると新規状態になるため【ターン1回】の使用回数もリセットする。
-    if dest_zone in [Zone.TRASH, Zone.HAND]:
+    if dest_zone in _RESET_STATUS_ZONES:
         card.reset_turn_status(clear_usage=True)
 
     # レスト（横向き）状態は場を離れたら必ず解除する。レストのキャラを手札/トラッシュ/
     # デッキへ戻すと横向きのまま戻ってしまう不具合を防ぐ（is_rest は場でのみ意味を持つ）。
-    if dest_zone in [Zone.TRASH, Zone.HAND, Zone.DECK]:
+    if dest_zone in _CLEAR_REST_ZONES:
         card.is_rest = False
         
     # フィールドから離れる場合、付与されていたドン‼をレスト状態で持ち主に返す
     if current_owner and current_list is not None and current_list is current_owner.field:
-        attached_dons = [d for d in current_owner.don_attached_cards if d.attached_to == card.uuid]
-        for don in attached_dons:
-            current_owner.don_attached_cards.remove(don)
-            don.attached_to = None
-            don.is_rest = True
-            current_owner.don_rested.append(don)
+        # 付与中ドン!!を1パスで「残す/返す」に振り分け、残す側で list を置き換える。
+        # 返す1枚ごとの remove（先頭からの探索＋詰め直し）を繰り返さず、並び順も保つ。
+        uuid = card.uuid
+        attached = current_owner.don_attached_cards
+        freed = [d for d in attached if d.attached_to == uuid]
+        if freed:
+            attached[:] = [d for d in attached if d.attached_to != uuid]
+            for don in freed:
+                don.attached_to = None
+                don.is_rest = True
+            current_owner.don_rested.extend(freed)
         card.attached_don = 0
         # 場を離れたら継続効果（timed_power/flags/keywords）を破棄する。
         gm.continuous.drop_for(card.uuid)
@@ -116,40 +187,63 @@ def move_card(gm, card: Card, dest_zone: Zone, dest_player: Player, dest_positio
     # 場（フィールド）からの離脱判定。キャラが場を離れた時(ON_LEAVE)誘発に使う。
     left_field = (current_owner is not None and current_list is not None
                   and current_list is current_owner.field
-                  and dest_zone != Zone.FIELD)
+                  and dest_zone != _ZONE_FIELD)
+
+    # 同じ list の中で既に行き先の端（TOP=先頭 / BOTTOM=末尾）にあるなら、remove→再挿入は
+    # 並びを変えない。O(N) の remove と再挿入（journal のスナップショットも）を省く。
+    # 状態リセット・ドン!!返却・離脱誘発は上下で従来どおり行う（list 操作だけを省く）。
+    # 行き先 list は表引き1回で決める（ステージ＝FIELD かつ STAGE だけは list ではなく枠）。
+    to_stage = dest_zone == _ZONE_FIELD and card.master.type == _TYPE_STAGE
+    attr = None if to_stage else _DEST_ZONE_ATTR.get(dest_zone)
+    target_list = getattr(dest_player, attr) if attr is not None else None
+    in_place = False
+    if current_list is not None and target_list is current_list:
+        in_place = current_list[0 if dest_position == "TOP" else -1] is card
 
-    if current_list is not None and card in current_list: current_list.remove(card)
-    elif current_owner and current_owner.stage == card: current_owner.stage = None
+    # current_list は _find_card_location が「card がそこに居る」ことを確かめて返したもの（上の
+    # 状態リセット/ドン!!返却は領域を動かさない）。再度の `in` は同じ走査の繰り返しなので省く。
+    if in_place: pass
+    elif current_list is not None: current_list.remove(card)
+    elif current_owner and current_owner.stage is card: current_owner.stage = None
 
     if left_life:
         gm._enqueue_life_decrease(current_owner, 1)
-    if left_field and card.master.type == CardType.CHARACTER:
+    if left_field and card.master.type == _TYPE_CHARACTER:
         gm._enqueue_on_leave(card, current_owner)
 
-    target_list = None
-    if dest_zone == Zone.FIELD and card.master.type == CardType.STAGE:
-        if dest_player.stage is not None: gm.move_card(dest_player.stage, Zone.TRASH, dest_player)
+    if to_stage:
+        if dest_player.stage is not None: gm.move_card(dest_player.stage, _ZONE_TRASH, dest_player)
         dest_player.stage = card
-    elif dest_zone == Zone.HAND: target_list = dest_player.hand
-    elif dest_zone == Zone.FIELD: target_list = dest_player.field
-    elif dest_zone == Zone.TRASH: target_list = dest_player.trash
-    elif dest_zone == Zone.LIFE: target_list = dest_player.life
-    elif dest_zone == Zone.DECK: target_list = dest_player.deck
-    elif dest_zone == Zone.TEMP: target_list = dest_player.temp_zone
-    
-    if target_list is not None:
-        if dest_position == "TOP": target_list.insert(0, card)
-        else: target_list.append(card)
+        _remember_location(gm, card, dest_player, None)
+    elif target_list is not None:
+        if not in_place:
+            if dest_position == "TOP": target_list.insert(0, card)
+            else: target_list.append(card)
+        _remember_location(gm, card, dest_player, attr)
 
 def pay_cost(gm, player: Player, cost: int, don_list: Optional[List[DonInstance]] = None):
     if don_list is not None:
         if len(don_list) < cost: raise ValueError("指定されたドン!!の数が不足しています。")
+        # 指定ドン!!ごとの `in`＋remove（各 O(枚数) の走査を2回）を繰り返さず、所属は集合で引き、
+        # 各ゾーンは支払わない分だけで1回に作り直す（並び順は保つ）。DonInstance は同一性で比較。
+        active, attached = player.don_active, player.don_attached_cards
+        in_active, in_attached = set(active), set(attached)
+        paid_active, paid_attached, paid = set(), set(), []
         for don in don_list:
-            if don in player.don_active: player.don_active.remove(don); player.don_rested.append(don); don.is_rest = True
-            elif don in player.don_attached_cards: player.don_attached_cards.remove(don); player.don_rested.append(don); don.is_rest = True; don.attached_to = None
+            if don in in_active and don not in paid_active:
+                paid_active.add(don); paid.append(don); don.is_rest = True
+            elif don in in_attached and don not in paid_attached:
+                paid_attached.add(don); paid.append(don); don.is_rest = True; don.attached_to = None
+        if paid_active: active[:] = [d for d in active if d not in paid_active]
+        if paid_attached: attached[:] = [d for d in attached if d not in paid_attached]
+        if paid: player.don_rested.extend(paid)
     else:
         if len(player.don_active) < cost: raise ValueError("ドン!!が不足しています。")
-        for _ in range(cost): don = player.don_active.pop(0); player.don_rested.append(don); don.is_rest = True
+        if cost <= 0: return
+        paid = player.don_active[:cost]
+        del player.don_active[:cost]
+        for don in paid: don.is_rest = True
+        player.don_rested.extend(paid)
 
 def _return_one_don(gm, tp: Player, don: DonInstance) -> bool:
     """ドン!!1枚を tp の場（アクティブ/レスト/付与中）から外しドン!!デッキへ戻す。
@@ -1,6 +1,7 @@
 """除去保護・置換効果・自己制限のガード判定（GameManager からの移管・ステートレス。第1引数 gm）。"""
 from __future__ import annotations
 
+import copy
 import re
 import logging
 
@@ -14,13 +15,10 @@ _logger = logging.getLogger("opcg.engine")
 
 def _has_rested_play(gm, player: Player) -> bool:
     """player が「自分のキャラはレストで登場する」PASSIVE を持つか（RESTED_PLAY マーカー）。"""
-    cards = ([player.leader] if player.leader else []) + list(player.field)
-    for c in cards:
-        if not c or getattr(c, "is_effect_negated", False) or not getattr(c, "master", None):
+    for c in player.iter_units(include_stage=False):
+        if getattr(c, "is_effect_negated", False) or not getattr(c, "master", None):
             continue
-        for ab in c.master.abilities:
-            if ab.trigger != TriggerType.PASSIVE:
-                continue
+        for ab in c.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
             act = gm._find_action(ab.effect, ActionType.RESTRICTION)
             if act is not None and getattr(act, "status", None) == "RESTED_PLAY":
                 return True
@@ -42,9 +40,7 @@ def _blocks_effect_play(gm, card: CardInstance) -> bool:
     """card が「手札のこのカードは効果で登場できない」PASSIVE を持つか（NO_EFFECT_PLAY）。"""
     if not card or not getattr(card, "master", None):
         return False
-    for ab in card.master.abilities:
-        if ab.trigger != TriggerType.PASSIVE:
-            continue
+    for ab in card.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
         act = gm._find_action(ab.effect, ActionType.RESTRICTION)
         if act is not None and getattr(act, "status", None) == "NO_EFFECT_PLAY":
             return True
@@ -85,9 +81,7 @@ def _active_protection(gm, card: CardInstance, status_values: Tuple[str, ...], a
     for protector in protectors:
         if getattr(protector, "is_effect_negated", False) or getattr(protector, "negated", False):
             continue
-        for ab in protector.master.abilities:
-            if ab.trigger != TriggerType.PASSIVE:
-                continue
+        for ab in protector.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
             eff = gm._find_action(ab.effect, ActionType.PREVENT_LEAVE)
             if eff is None:
                 continue
@@ -147,9 +141,7 @@ def _find_replacement(gm, card: CardInstance, status_values: Tuple[str, ...]):
     for protector in candidates:
         if getattr(protector, 'is_effect_negated', False):
             continue
-        for ab in protector.master.abilities:
-            if ab.trigger != TriggerType.PASSIVE:
-                continue
+        for ab in protector.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
             eff = gm._find_action(ab.effect, ActionType.REPLACE_EFFECT)
             if eff is None:
                 continue
@@ -208,7 +200,6 @@ def _register_granted_replacements(gm, player: Player, source_card: Card) -> Non
     """カウンターイベント等が持つ REPLACE_EFFECT を「このターン中」付与の置換として登録する。
     イベントは場に残らないため、被除去キャラ側から参照できるよう player へ退避する
     （EB02-030「自分のキャラすべては、このターン中、バトルでKOされる場合、代わりに〜できる」）。"""
-    import copy
     for ability in source_card.master.abilities:
         eff = gm._find_action(ability.effect, ActionType.REPLACE_EFFECT)
         if eff is None:
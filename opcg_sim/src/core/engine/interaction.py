@@ -8,11 +8,37 @@ import logging
 from ..journal import JournaledList, JournaledSet
 from ..rules_constants import FIELD_LIMIT
 from ...models.models import CONST
-from ...models.enums import Phase, Zone, CardType, TriggerType, PendingMessage
+from ...models.enums import Phase, Zone, PendingMessage
 from ..effects.resolver import EffectResolver
+from .battle import _can_block
 
 _logger = logging.getLogger("opcg.engine")
 
+# 共有定数（shared_constants.json）のキー/アクション種別は読込時に1回だけ解決する（CONST は実行時に
+# 再読込されない）。get_pending_request/_validate_action は UI ポーリング・CPU 探索の葉ごとに呼ばれる
+# ホットパスなので、呼び出しごとの入れ子 CONST.get 連鎖を避ける（action_api の ACT_*/BACT_* と同じ方式）。
+_PENDING_PROPS = CONST.get('PENDING_REQUEST_PROPERTIES', {})
+_C_TO_S = CONST.get('c_to_s_interface', {})
+_BATTLE_ACTIONS = _C_TO_S.get('BATTLE_ACTIONS', {}).get('TYPES', {})
+_KEY_PID = _PENDING_PROPS.get('PLAYER_ID', 'player_id')
+_KEY_ACTION = _PENDING_PROPS.get('ACTION', 'action')
+_KEY_MSG = _PENDING_PROPS.get('MESSAGE', 'message')
+_KEY_UUIDS = _PENDING_PROPS.get('SELECTABLE_UUIDS', 'selectable_uuids')
+_KEY_SKIP = _PENDING_PROPS.get('CAN_SKIP', 'can_skip')
+_KEY_CANDIDATES = _PENDING_PROPS.get('CANDIDATES', 'candidates')
+_KEY_CONSTRAINTS = _PENDING_PROPS.get('CONSTRAINTS', 'constraints')
+_KEY_SOURCE_UUID = _PENDING_PROPS.get('SOURCE_CARD_UUID', 'source_card_uuid')
+_ACT_BLOCKER = _BATTLE_ACTIONS.get('SELECT_BLOCKER', 'SELECT_BLOCKER')
+_ACT_COUNTER = _BATTLE_ACTIONS.get('SELECT_COUNTER', 'SELECT_COUNTER')
+_ACT_PASS = _BATTLE_ACTIONS.get('PASS', 'PASS')
+_ACT_MAIN = "MAIN_ACTION"
+_RESOLVE_SELECTION = (_C_TO_S.get('GAME_ACTIONS', {}).get('TYPES', {})
+                      .get('RESOLVE_EFFECT_SELECTION', 'RESOLVE_EFFECT_SELECTION'))
+# PendingMessage（str Enum）の .value も定数化する（要求ごとの Enum 属性解決を省く）。
+_MSG_MAIN_ACTION = PendingMessage.MAIN_ACTION.value
+_MSG_SELECT_BLOCKER = PendingMessage.SELECT_BLOCKER.value
+_MSG_SELECT_COUNTER = PendingMessage.SELECT_COUNTER.value
+
 
 def resolve_interaction(gm, player: Player, payload: Dict[str, Any]):
     if not gm.active_interaction:
@@ -59,8 +85,11 @@ def resolve_interaction(gm, player: Player, payload: Dict[str, Any]):
         owner = gm.p1 if gm.p1.name == continuation.get("owner_name") else gm.p2
         selected = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
         gm.active_interaction = None
+        # uuid→キャラの表を1回作って引く（選択数×場の枚数の線形探索を避ける）。pop で引くため
+        # 同じ uuid が重複して送られても2度目は移動しない（従来の「場から探す」と同じ結果）。
+        field_by_uuid = {c.uuid: c for c in owner.field}
         for uid in selected:
-            card = next((c for c in owner.field if c.uuid == uid), None)
+            card = field_by_uuid.pop(uid, None)
             if card:
                 gm.move_card(card, Zone.TRASH, owner)
         gm.refresh_passive_state()
@@ -82,134 +111,11 @@ def resolve_interaction(gm, player: Player, payload: Dict[str, Any]):
 
     resolver = EffectResolver(gm)
     
-    if action_type == "SELECT_TARGET":
-        selected_uuids = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
-        
-        selected_cards = []
-        candidates = gm.active_interaction.get("candidates", [])
-        for uid in selected_uuids:
-            card = next((c for c in candidates if c.uuid == uid), None)
-            if card: selected_cards.append(card)
-        
-        query = continuation.get("query")
-
-        # ▼▼▼ 修正: save_idがなくても、一時的に選択結果を渡せるようにする ▼▼▼
-        if "effect_context" in continuation:
-            continuation["effect_context"]["temp_resolved_targets"] = selected_cards
-
-        if query and getattr(query, 'save_id', None):
-             continuation["effect_context"]["saved_targets"][query.save_id] = selected_cards
-        
-        gm.active_interaction = None
-        resolver.resume_execution(player, source_card, continuation.get("execution_stack", []), continuation.get("effect_context", {}))
-
-    elif action_type == "SELECT_RESOURCE":
-        # ドン!!返却(RETURN_DON)の対象ドン!!選択。選んだ uuid を context に載せて再開すると、
-        # RETURN_DON 再実行時に当該ドン!!を戻す。
-        selected_uuids = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
-        effect_context = continuation.get("effect_context", {})
-        effect_context["_return_don_uuids"] = selected_uuids
-        gm.active_interaction = None
-        # RETURN_DON は効果の責任者（source_card の持ち主）視点で再実行する。
-        # 「相手は自身の場のドン!!を戻す」（status=OPPONENT）では選択者＝相手だが、
-        # _don_pool_player は player を基準に相手プールを引くため、応答者(相手)で再開すると
-        # 相手の相手=自分のプールを指して空振りする。責任者基準なら選んだ相手ドンが正しく戻る。
-        controller = gm.p1 if gm.p1.name == source_card.owner_id else gm.p2
-        resolver.resume_execution(controller, source_card, continuation.get("execution_stack", []), effect_context)
-
-    elif action_type == "CHOICE":
-        selected_index = payload.get("index", payload.get("selected_option_index", 0))
-
-        resolver.resume_choice(player, source_card, selected_index, continuation.get("execution_stack", []), continuation.get("effect_context", {}))
-
-    elif action_type == "CONFIRM_OPTIONAL":
-        # 任意効果（「〜してもよい」）/ 任意コスト能力（「〜できる：」）の発動可否。
-        # accepted=False（パス/拒否）ならスキップ。
-        accepted = payload.get("accepted")
-        if accepted is None:
-            # selected_uuids 非空 / index>0 / skip フラグ等から推定（既定は発動=True）
-            if payload.get("skip") is True or payload.get("declined") is True:
-                accepted = False
-            else:
-                accepted = payload.get("index", 0) == 0
-        # 任意バトルKO置換（A）の確認: accept→置換実行（本来のKOをスキップ）、
-        # decline→本来のKOを実行。どちらも _finish_attack で戦闘後処理して return。
-        if continuation.get("kind") == "BATTLE_KO_REPLACE":
-            gm.active_interaction = None
-            target = source_card
-            target_owner = gm.p1 if gm.p1.name == continuation.get("target_owner_name") else gm.p2
-            life_lost = continuation.get("life_lost", 0)
-            if accepted and gm._active_replacement(target, ("BATTLE_KO",)):
-                pass
-            else:
-                # 拒否、または置換が成立しなくなった場合は本来の KO を進める。
-                gm.move_card(target, Zone.TRASH, target_owner)
-                gm._resolve_on_ko(target, target_owner, cause="BATTLE")
-            gm._finish_attack(target, target_owner, life_lost)
-            return
-        gm.active_interaction = None
-        confirm_ability = continuation.get("confirm_ability")
-        if confirm_ability is not None:
-            # 任意コスト能力（A-3）の使用確認: accept で cost_confirmed=True で再入。
-            # decline は何もしない（使用回数も未消費）。gamestate 経由で action_events を記録。
-            if accepted:
-                gm.resolve_ability(player, confirm_ability, source_card, cost_confirmed=True)
-        else:
-            optional_node = continuation.get("optional_node")
-            resolver.resume_optional(player, source_card, bool(accepted), optional_node,
-                                     continuation.get("execution_stack", []), continuation.get("effect_context", {}))
-
-    elif action_type == "ARRANGE_DECK":
-        # (2a)(2b) 並び替え/上下選択の確定。selected_uuids が配置順、position が上下。
-        # ヘッドレス(drain)は selected_uuids=[] / position 無し → 現状順・fixed_position。
-        ordered_uuids = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
-        position = (payload.get("position") or payload.get("extra", {}).get("position")
-                    or continuation.get("fixed_position", "BOTTOM"))
-        position = "TOP" if str(position).upper() == "TOP" else "BOTTOM"
-        cards = continuation.get("arrange_targets", [])
-        if ordered_uuids:
-            by_uuid = {c.uuid: c for c in cards}
-            ordered = [by_uuid[u] for u in ordered_uuids if u in by_uuid]
-            for c in cards:  # 指定漏れは元の順序で末尾に補う
-                if c not in ordered:
-                    ordered.append(c)
-        else:
-            ordered = list(cards)
-        dest_kind = continuation.get("dest_kind", "DECK")
-        gm.active_interaction = None
-        if dest_kind == "LIFE":
-            # ライフ並べ替え: ordered を新しいライフ順とする（life[0]=一番上）。
-            owner_name = continuation.get("dest_owner")
-            tp = gm.p1 if (owner_name and gm.p1.name == owner_name) else (gm.p2 if owner_name else player)
-            rest = [c for c in tp.life if c not in ordered]
-            tp.life = JournaledList(ordered + rest)
-        else:
-            # デッキ配置: BOTTOM は順に append（先頭が上）、TOP は逆順 insert(0) で
-            # ordered[0] が最上面になるようにする。
-            seq = ordered if position == "BOTTOM" else list(reversed(ordered))
-            for c in seq:
-                owner, _ = gm._find_card_location(c)
-                if owner:
-                    gm.move_card(c, Zone.DECK, owner, dest_position=position)
-        resolver.resume_execution(player, source_card, continuation.get("execution_stack", []), continuation.get("effect_context", {}))
-
-    elif action_type == "DECLARE_COST":
-        # C8: 宣言コストを記録し、相手デッキトップを公開して context に保存してから再開。
-        declared = payload.get("declared_value", payload.get("index", 0))
-        try:
-            declared = int(declared)
-        except (TypeError, ValueError):
-            declared = 0
-        effect_context = continuation.get("effect_context", {})
-        effect_context["declared_cost"] = declared
-        opponent = gm.p2 if player == gm.p1 else gm.p1
-        revealed = opponent.deck[0] if opponent.deck else None
-        if revealed is not None:
-            effect_context["last_revealed_card"] = revealed
-        else:
-            pass
-        gm.active_interaction = None
-        resolver.resume_execution(player, source_card, continuation.get("execution_stack", []), effect_context)
+    # 再開種別ごとのハンドラ（_RESUME_HANDLERS）へ表引きで振り分ける。True は後処理まで
+    # 完結した（任意バトルKO置換の確認など）ことを示し、以降の共通末尾を通らない。
+    handler = _RESUME_HANDLERS.get(action_type)
+    if handler is not None and handler(gm, player, payload, continuation, source_card, resolver):
+        return
 
     # 再開経路（resume_execution/resume_choice/resume_optional）で実行された
     # アクションも action_events へ記録する（resolve_ability 経由と同じ扱い。
@@ -264,6 +170,157 @@ def resolve_interaction(gm, player: Player, payload: Dict[str, Any]):
                 gm._enforce_field_limit(pl)
                 break
 
+
+def _resume_select_target(gm, player: Player, payload: Dict[str, Any], continuation: Dict[str, Any],
+                          source_card: Card, resolver: EffectResolver) -> bool:
+    selected_uuids = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
+
+    candidates = gm.active_interaction.get("candidates", [])
+    cand_by_uuid = {c.uuid: c for c in candidates}
+    selected_cards = [cand_by_uuid[uid] for uid in selected_uuids if uid in cand_by_uuid]
+
+    query = continuation.get("query")
+
+    # ▼▼▼ 修正: save_idがなくても、一時的に選択結果を渡せるようにする ▼▼▼
+    if "effect_context" in continuation:
+        continuation["effect_context"]["temp_resolved_targets"] = selected_cards
+
+    if query and getattr(query, 'save_id', None):
+         continuation["effect_context"]["saved_targets"][query.save_id] = selected_cards
+
+    gm.active_interaction = None
+    resolver.resume_execution(player, source_card, continuation.get("execution_stack", []), continuation.get("effect_context", {}))
+    return False
+
+def _resume_select_resource(gm, player: Player, payload: Dict[str, Any], continuation: Dict[str, Any],
+                            source_card: Card, resolver: EffectResolver) -> bool:
+    # ドン!!返却(RETURN_DON)の対象ドン!!選択。選んだ uuid を context に載せて再開すると、
+    # RETURN_DON 再実行時に当該ドン!!を戻す。
+    selected_uuids = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
+    effect_context = continuation.get("effect_context", {})
+    effect_context["_return_don_uuids"] = selected_uuids
+    gm.active_interaction = None
+    # RETURN_DON は効果の責任者（source_card の持ち主）視点で再実行する。
+    # 「相手は自身の場のドン!!を戻す」（status=OPPONENT）では選択者＝相手だが、
+    # _don_pool_player は player を基準に相手プールを引くため、応答者(相手)で再開すると
+    # 相手の相手=自分のプールを指して空振りする。責任者基準なら選んだ相手ドンが正しく戻る。
+    controller = gm.p1 if gm.p1.name == source_card.owner_id else gm.p2
+    resolver.resume_execution(controller, source_card, continuation.get("execution_stack", []), effect_context)
+    return False
+
+def _resume_choice(gm, player: Player, payload: Dict[str, Any], continuation: Dict[str, Any],
+                   source_card: Card, resolver: EffectResolver) -> bool:
+    selected_index = payload.get("index", payload.get("selected_option_index", 0))
+
+    resolver.resume_choice(player, source_card, selected_index, continuation.get("execution_stack", []), continuation.get("effect_context", {}))
+    return False
+
+def _resume_confirm_optional(gm, player: Player, payload: Dict[str, Any], continuation: Dict[str, Any],
+                             source_card: Card, resolver: EffectResolver) -> bool:
+    # 任意効果（「〜してもよい」）/ 任意コスト能力（「〜できる：」）の発動可否。
+    # accepted=False（パス/拒否）ならスキップ。
+    accepted = payload.get("accepted")
+    if accepted is None:
+        # selected_uuids 非空 / index>0 / skip フラグ等から推定（既定は発動=True）
+        if payload.get("skip") is True or payload.get("declined") is True:
+            accepted = False
+        else:
+            accepted = payload.get("index", 0) == 0
+    # 任意バトルKO置換（A）の確認: accept→置換実行（本来のKOをスキップ）、
+    # decline→本来のKOを実行。どちらも _finish_attack で戦闘後処理して return。
+    if continuation.get("kind") == "BATTLE_KO_REPLACE":
+        gm.active_interaction = None
+        target = source_card
+        target_owner = gm.p1 if gm.p1.name == continuation.get("target_owner_name") else gm.p2
+        life_lost = continuation.get("life_lost", 0)
+        if accepted and gm._active_replacement(target, ("BATTLE_KO",)):
+            pass
+        else:
+            # 拒否、または置換が成立しなくなった場合は本来の KO を進める。
+            gm.move_card(target, Zone.TRASH, target_owner)
+            gm._resolve_on_ko(target, target_owner, cause="BATTLE")
+        gm._finish_attack(target, target_owner, life_lost)
+        return True
+    gm.active_interaction = None
+    confirm_ability = continuation.get("confirm_ability")
+    if confirm_ability is not None:
+        # 任意コスト能力（A-3）の使用確認: accept で cost_confirmed=True で再入。
+        # decline は何もしない（使用回数も未消費）。gamestate 経由で action_events を記録。
+        if accepted:
+            gm.resolve_ability(player, confirm_ability, source_card, cost_confirmed=True)
+    else:
+        optional_node = continuation.get("optional_node")
+        resolver.resume_optional(player, source_card, bool(accepted), optional_node,
+                                 continuation.get("execution_stack", []), continuation.get("effect_context", {}))
+    return False
+
+def _resume_arrange_deck(gm, player: Player, payload: Dict[str, Any], continuation: Dict[str, Any],
+                         source_card: Card, resolver: EffectResolver) -> bool:
+    # (2a)(2b) 並び替え/上下選択の確定。selected_uuids が配置順、position が上下。
+    # ヘッドレス(drain)は selected_uuids=[] / position 無し → 現状順・fixed_position。
+    ordered_uuids = payload.get("selected_uuids") or payload.get("extra", {}).get("selected_uuids", [])
+    position = (payload.get("position") or payload.get("extra", {}).get("position")
+                or continuation.get("fixed_position", "BOTTOM"))
+    position = "TOP" if str(position).upper() == "TOP" else "BOTTOM"
+    cards = continuation.get("arrange_targets", [])
+    if ordered_uuids:
+        by_uuid = {c.uuid: c for c in cards}
+        ordered = [by_uuid[u] for u in ordered_uuids if u in by_uuid]
+        for c in cards:  # 指定漏れは元の順序で末尾に補う
+            if c not in ordered:
+                ordered.append(c)
+    else:
+        ordered = list(cards)
+    dest_kind = continuation.get("dest_kind", "DECK")
+    gm.active_interaction = None
+    if dest_kind == "LIFE":
+        # ライフ並べ替え: ordered を新しいライフ順とする（life[0]=一番上）。
+        owner_name = continuation.get("dest_owner")
+        tp = gm.p1 if (owner_name and gm.p1.name == owner_name) else (gm.p2 if owner_name else player)
+        rest = [c for c in tp.life if c not in ordered]
+        tp.life = JournaledList(ordered + rest)
+    else:
+        # デッキ配置: BOTTOM は順に append（先頭が上）、TOP は逆順 insert(0) で
+        # ordered[0] が最上面になるようにする。
+        seq = ordered if position == "BOTTOM" else list(reversed(ordered))
+        for c in seq:
+            owner, _ = gm._find_card_location(c)
+            if owner:
+                gm.move_card(c, Zone.DECK, owner, dest_position=position)
+    resolver.resume_execution(player, source_card, continuation.get("execution_stack", []), continuation.get("effect_context", {}))
+    return False
+
+def _resume_declare_cost(gm, player: Player, payload: Dict[str, Any], continuation: Dict[str, Any],
+                         source_card: Card, resolver: EffectResolver) -> bool:
+    # C8: 宣言コストを記録し、相手デッキトップを公開して context に保存してから再開。
+    declared = payload.get("declared_value", payload.get("index", 0))
+    try:
+        declared = int(declared)
+    except (TypeError, ValueError):
+        declared = 0
+    effect_context = continuation.get("effect_context", {})
+    effect_context["declared_cost"] = declared
+    opponent = gm.p2 if player == gm.p1 else gm.p1
+    revealed = opponent.deck[0] if opponent.deck else None
+    if revealed is not None:
+        effect_context["last_revealed_card"] = revealed
+    else:
+        pass
+    gm.active_interaction = None
+    resolver.resume_execution(player, source_card, continuation.get("execution_stack", []), effect_context)
+    return False
+
+# resolve_interaction の再開種別 → ハンドラ。CONFIRM_TRIGGER / FIELD_OVERFLOW_TRASH は発生源カードを
+# 持たないため表に載せず、resolve_interaction 冒頭で個別に処理する。
+_RESUME_HANDLERS = {
+    "SELECT_TARGET": _resume_select_target,
+    "SELECT_RESOURCE": _resume_select_resource,
+    "CHOICE": _resume_choice,
+    "CONFIRM_OPTIONAL": _resume_confirm_optional,
+    "ARRANGE_DECK": _resume_arrange_deck,
+    "DECLARE_COST": _resume_declare_cost,
+}
+
 def get_pending_request(gm, with_request_id: bool = True) -> Optional[Dict[str, Any]]:
     # with_request_id=False: CPU 探索/自己対戦のドレイン経路など request_id を読まない呼び出し用の
     # 高速パス。request_id は**フロント専用**（入力側で未使用・下記 _rid コメント参照）なので、
@@ -271,16 +328,6 @@ def get_pending_request(gm, with_request_id: bool = True) -> Optional[Dict[str,
     # MCTS は _simulate ごとに _drain_own_interactions→get_pending_request を大量に呼ぶため、
     # 候補が多い盤面ではこのハッシュが CPU を占有し 1 バッチが病的に遅くなる（w3 実測: 通常 ~300s の
     # バッチが >13min 停滞）。既定 True で従来挙動・API 契約（test_api_contract の request_id 安定性）は不変。
-    pending_props = CONST.get('PENDING_REQUEST_PROPERTIES', {})
-    battle_actions = CONST.get('c_to_s_interface', {}).get('BATTLE_ACTIONS', {}).get('TYPES', {})
-    KEY_PID = pending_props.get('PLAYER_ID', 'player_id')
-    KEY_ACTION = pending_props.get('ACTION', 'action')
-    KEY_MSG = pending_props.get('MESSAGE', 'message')
-    KEY_UUIDS = pending_props.get('SELECTABLE_UUIDS', 'selectable_uuids')
-    KEY_SKIP = pending_props.get('CAN_SKIP', 'can_skip')
-    KEY_CANDIDATES = pending_props.get('CANDIDATES', 'candidates')
-    KEY_CONSTRAINTS = pending_props.get('CONSTRAINTS', 'constraints')
-    KEY_OPTIONS = pending_props.get('OPTIONS', 'options')
 
     def _rid(d: Dict[str, Any]) -> str:
         # request_id は「同一の要求なら安定・要求が変われば変化」する決定的ハッシュにする。
@@ -309,47 +356,53 @@ def get_pending_request(gm, with_request_id: bool = True) -> Optional[Dict[str,
             if player.name not in gm.mulligan_done:
                 hand_candidates = [c.to_dict() for c in player.hand]
                 _mreq = {
-                    KEY_PID: player.name,
-                    KEY_ACTION: "MULLIGAN",
-                    KEY_MSG: "マリガンするカードを選んでください（交換なし＝キープ）",
-                    KEY_CANDIDATES: hand_candidates,
-                    KEY_UUIDS: [c.uuid for c in player.hand],
-                    KEY_CONSTRAINTS: {"min": 0, "max": len(player.hand)},
-                    KEY_SKIP: True,
+                    _KEY_PID: player.name,
+                    _KEY_ACTION: "MULLIGAN",
+                    _KEY_MSG: "マリガンするカードを選んでください（交換なし＝キープ）",
+                    _KEY_CANDIDATES: hand_candidates,
+                    _KEY_UUIDS: [c.uuid for c in player.hand],
+                    _KEY_CONSTRAINTS: {"min": 0, "max": len(player.hand)},
+                    _KEY_SKIP: True,
                 }
                 _mreq["request_id"] = _rid(_mreq)
                 return _mreq
         return None
 
-    if gm.active_interaction:
-        action_type = gm.active_interaction.get("action_type")
+    ai = gm.active_interaction  # property（スタック先頭）の解決は1回だけにする
+    if ai:
+        action_type = ai.get("action_type")
         fe_action = "SEARCH_AND_SELECT" if action_type in ("SELECT_TARGET", "FIELD_OVERFLOW_TRASH") else action_type
         
-        candidates = gm.active_interaction.get("candidates", [])
-        candidate_uuids = [c.uuid for c in candidates] if candidates else []
+        candidates = ai.get("candidates", [])
+        # selectable_uuids は中断を立てた側がほぼ常に明示する。候補 uuid のリストは
+        # その既定値としてしか使わないため、未指定のときだけ作る（毎ポーリングの割当を省く）。
+        if "selectable_uuids" in ai:
+            selectable_uuids = ai["selectable_uuids"]
+        else:
+            selectable_uuids = [c.uuid for c in candidates] if candidates else []
         # candidate_dicts（各候補の to_dict）は**フロント表示専用**（既定解決＝default_interaction_payload
         # は selectable_uuids/constraints しか読まない）。候補が多い盤面では c.to_dict() のリスト構築が
         # MCTS のドレイン経路で CPU を占有するため、request_id 不要の高速パスでは丸ごと省く。
         candidate_dicts = ([c.to_dict() for c in candidates] if candidates else []) if with_request_id else []
         
         req = {
-            KEY_PID: gm.active_interaction.get("player_id"),
-            KEY_ACTION: fe_action,
-            KEY_MSG: gm.active_interaction.get("message", "選択してください"),
-            KEY_UUIDS: gm.active_interaction.get("selectable_uuids", candidate_uuids),
-            KEY_SKIP: gm.active_interaction.get("can_skip", False),
-            KEY_CANDIDATES: candidate_dicts,
-            KEY_CONSTRAINTS: gm.active_interaction.get("constraints"),
-            "options": gm.active_interaction.get("options"),
+            _KEY_PID: ai.get("player_id"),
+            _KEY_ACTION: fe_action,
+            _KEY_MSG: ai.get("message", "選択してください"),
+            _KEY_UUIDS: selectable_uuids,
+            _KEY_SKIP: ai.get("can_skip", False),
+            _KEY_CANDIDATES: candidate_dicts,
+            _KEY_CONSTRAINTS: ai.get("constraints"),
+            "options": ai.get("options"),
         }
         # 効果の発生源カードを UI で表示できるよう uuid を併せて渡す。
-        src_uuid = gm.active_interaction.get("source_card_uuid")
+        src_uuid = ai.get("source_card_uuid")
         if src_uuid:
-            req[pending_props.get('SOURCE_CARD_UUID', 'source_card_uuid')] = src_uuid
+            req[_KEY_SOURCE_UUID] = src_uuid
         # ARRANGE_DECK(並び替え/上下選択)はフロントの UI 切替フラグを併せて渡す。
         if action_type == "ARRANGE_DECK":
-            req["allow_position"] = gm.active_interaction.get("allow_position", False)
-            req["allow_reorder"] = gm.active_interaction.get("allow_reorder", False)
+            req["allow_position"] = ai.get("allow_position", False)
+            req["allow_reorder"] = ai.get("allow_reorder", False)
         req["request_id"] = _rid(req)
         return req
 
@@ -357,13 +410,10 @@ def get_pending_request(gm, with_request_id: bool = True) -> Optional[Dict[str,
         gm.phase = Phase.MAIN
         
     request = None
-    ACT_BLOCKER = battle_actions.get('SELECT_BLOCKER', 'SELECT_BLOCKER')
-    ACT_COUNTER = battle_actions.get('SELECT_COUNTER', 'SELECT_COUNTER')
-    
     if gm.phase == Phase.BLOCK_STEP and gm.active_battle:
         target_owner = gm.active_battle["target_owner"]
-        blockers = [c.uuid for c in target_owner.field if not c.is_rest and c.has_keyword("ブロッカー") and "CANNOT_REST" not in c.timed_flags]
-        request = {KEY_PID: target_owner.name, KEY_ACTION: ACT_BLOCKER, KEY_MSG: PendingMessage.SELECT_BLOCKER.value, KEY_UUIDS: blockers, KEY_SKIP: True}
+        blockers = [c.uuid for c in target_owner.field if _can_block(c)]
+        request = {_KEY_PID: target_owner.name, _KEY_ACTION: _ACT_BLOCKER, _KEY_MSG: _MSG_SELECT_BLOCKER, _KEY_UUIDS: blockers, _KEY_SKIP: True}
     elif gm.phase == Phase.BATTLE_COUNTER and gm.active_battle:
         target_owner = gm.active_battle["target_owner"]
         # カウンター候補: (a) counter 値を持つカード（手札から捨てるだけ＝コスト不要）／
@@ -373,16 +423,20 @@ def get_pending_request(gm, with_request_id: bool = True) -> Optional[Dict[str,
         _don_active = len(target_owner.don_active)
         counters = [c.uuid for c in target_owner.hand
                     if c.current_counter > 0
-                    or (c.master.type == CardType.EVENT
-                        and any(abil.trigger == TriggerType.COUNTER for abil in c.master.abilities)
-                        and (c.master.cost or 0) <= _don_active)]
-        request = {KEY_PID: target_owner.name, KEY_ACTION: ACT_COUNTER, KEY_MSG: PendingMessage.SELECT_COUNTER.value, KEY_UUIDS: counters, KEY_SKIP: True}
+                    or (c.master.is_counter_event and (c.master.cost or 0) <= _don_active)]
+        request = {_KEY_PID: target_owner.name, _KEY_ACTION: _ACT_COUNTER, _KEY_MSG: _MSG_SELECT_COUNTER, _KEY_UUIDS: counters, _KEY_SKIP: True}
     elif gm.phase == Phase.MAIN:
-        selectable = [c.uuid for c in gm.turn_player.hand]
-        selectable += [c.uuid for c in gm.turn_player.field if not c.is_rest]
-        if gm.turn_player.leader and not gm.turn_player.leader.is_rest:
-            selectable.append(gm.turn_player.leader.uuid)
-        request = {KEY_PID: gm.turn_player.name, KEY_ACTION: "MAIN_ACTION", KEY_MSG: PendingMessage.MAIN_ACTION.value, KEY_UUIDS: selectable, KEY_SKIP: True}
+        # 毎回作り直す（手札/場/レスト状態は効果処理・テストが直接書き換えるため、dirty フラグで
+        # キャッシュすると取りこぼしで古い候補を返しうる）。リストは1本だけ作って伸ばす。
+        # uuid の取り出しは内包表記のまま（CPython 3.11 では属性読みが特殊化されるため、
+        # map(attrgetter("uuid"), ...) の方が遅い: 手札5枚で ~1.4倍・40枚で ~3倍の実測）。
+        tp = gm.turn_player
+        selectable = [c.uuid for c in tp.hand]
+        selectable.extend(c.uuid for c in tp.field if not c.is_rest)
+        leader = tp.leader
+        if leader and not leader.is_rest:
+            selectable.append(leader.uuid)
+        request = {_KEY_PID: tp.name, _KEY_ACTION: _ACT_MAIN, _KEY_MSG: _MSG_MAIN_ACTION, _KEY_UUIDS: selectable, _KEY_SKIP: True}
     if request is not None:
         request["request_id"] = _rid(request)
     return request
@@ -398,11 +452,8 @@ def default_interaction_payload(gm, pending: Optional[Dict[str, Any]] = None) ->
     """
     if pending is None:
         pending = gm.get_pending_request() or {}
-    pending_props = CONST.get('PENDING_REQUEST_PROPERTIES', {})
-    KEY_UUIDS = pending_props.get('SELECTABLE_UUIDS', 'selectable_uuids')
-    KEY_CONSTRAINTS = pending_props.get('CONSTRAINTS', 'constraints')
-    uuids = list(pending.get(KEY_UUIDS, []) or [])
-    constraints = pending.get(KEY_CONSTRAINTS) or {}
+    uuids = list(pending.get(_KEY_UUIDS, []) or [])
+    constraints = pending.get(_KEY_CONSTRAINTS) or {}
     try:
         min_n = int(constraints.get("min", 0))
     except (TypeError, ValueError):
@@ -445,13 +496,12 @@ def pending_actor_action(gm) -> Optional[Tuple[str, str]]:
         return (gm.active_interaction.get("player_id"), fe)
     if not gm.active_battle and gm.phase in (Phase.BLOCK_STEP, Phase.BATTLE_COUNTER):
         gm.phase = Phase.MAIN  # get_pending_request と同じ副作用
-    battle_actions = CONST.get('c_to_s_interface', {}).get('BATTLE_ACTIONS', {}).get('TYPES', {})
     if gm.phase == Phase.BLOCK_STEP and gm.active_battle:
-        return (gm.active_battle["target_owner"].name, battle_actions.get('SELECT_BLOCKER', 'SELECT_BLOCKER'))
+        return (gm.active_battle["target_owner"].name, _ACT_BLOCKER)
     if gm.phase == Phase.BATTLE_COUNTER and gm.active_battle:
-        return (gm.active_battle["target_owner"].name, battle_actions.get('SELECT_COUNTER', 'SELECT_COUNTER'))
+        return (gm.active_battle["target_owner"].name, _ACT_COUNTER)
     if gm.phase == Phase.MAIN:
-        return (gm.turn_player.name, "MAIN_ACTION")
+        return (gm.turn_player.name, _ACT_MAIN)
     return None
 
 def _defer_resolver_stack(gm, player: Player, source_card, execution_stack, context) -> None:
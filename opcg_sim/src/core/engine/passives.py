@@ -4,6 +4,7 @@ from __future__ import annotations
 import unicodedata
 
 from .. import journal
+from ..journal import JournaledSet
 from ...models.enums import TriggerType
 from ...models.effect_types import GameAction, Sequence, Branch, Choice
 from ..effects.resolver import EffectResolver
@@ -75,7 +76,7 @@ def _apply_passive_effects(gm, player: Player):
     # 探索の支配コスト。大半のカードはバフ 0 ＝ no-op 代入なので、ガードで journaling 量を削る。
     # 最終状態は無条件代入と完全同一＝挙動・方策不変）。
     for p in [player, opponent]:
-        for c in ([p.leader] if p.leader else []) + p.field + ([p.stage] if p.stage else []):
+        for c in p.iter_units():
             if c:
                 if c.cost_buff:
                     c.cost_buff = 0
@@ -84,7 +85,9 @@ def _apply_passive_effects(gm, player: Player):
                 if c.passive_power_override is not None:
                     c.passive_power_override = None
                 if c.current_keywords != c.master.keywords:
-                    c.current_keywords = c.master.keywords.copy()
+                    # master.keywords は素の set。そのコピーを入れると以降の in-place 変更
+                    # （BLOCKER_DISABLE の discard 等）が探索の巻き戻しから漏れるため journaled 型で持つ。
+                    c.current_keywords = JournaledSet(c.master.keywords)
         for c in p.hand:
             if c:
                 if c.cost_buff:
@@ -100,36 +103,34 @@ def _apply_passive_effects(gm, player: Player):
         # Step 2: YOUR_TURN 効果（アクティブプレイヤーのカードのみ）
         #   ステージ（player.stage）も対象に含める。聖地マリージョア(コスト軽減)・
         #   虚の玉座(リーダー+1000) 等の STAGE の YOUR_TURN 効果が従来発動していなかった。
-        for card in ([player.leader] if player.leader else []) + player.field + ([player.stage] if player.stage else []):
+        # 効果解決中に場が動いても走査対象がずれないよう、開始時点のユニットを固定する。
+        for card in tuple(player.iter_units()):
             if not card or not card.master.abilities: continue
-            for ability in card.master.abilities:
-                if ability.trigger == TriggerType.YOUR_TURN:
-                    if gm._is_reactive_passive(ability):
-                        continue  # 「【自分のターン中】…された時」型はイベント誘発（EB02-035 等）
-                    gm.resolve_ability(player, ability, source_card=card)
+            for ability in card.master.abilities_by_trigger.get(TriggerType.YOUR_TURN, ()):
+                if gm._is_reactive_passive(ability):
+                    continue  # 「【自分のターン中】…された時」型はイベント誘発（EB02-035 等）
+                gm.resolve_ability(player, ability, source_card=card)
 
         # Step 2': OPPONENT_TURN 効果（非アクティブプレイヤーのカードのみ）。
         #   「【相手のターン中】自分のキャラすべてをコスト+1」(OP16-080) 等の継続効果。
         #   コントローラから見て「相手のターン」＝非ターンプレイヤーのカードが該当する。
         #   YOUR_TURN と同じく再計算レイヤ（cost_buff/passive_power）へ載るため、
         #   ターンが替われば自然に消える。
-        for card in ([opponent.leader] if opponent.leader else []) + opponent.field + ([opponent.stage] if opponent.stage else []):
+        for card in tuple(opponent.iter_units()):
             if not card or not card.master.abilities: continue
-            for ability in card.master.abilities:
-                if ability.trigger == TriggerType.OPPONENT_TURN:
-                    if gm._is_reactive_passive(ability):
-                        continue  # 「【相手のターン中】…された時」型はイベント誘発
-                    gm.resolve_ability(opponent, ability, source_card=card)
+            for ability in card.master.abilities_by_trigger.get(TriggerType.OPPONENT_TURN, ()):
+                if gm._is_reactive_passive(ability):
+                    continue  # 「【相手のターン中】…された時」型はイベント誘発
+                gm.resolve_ability(opponent, ability, source_card=card)
 
         # Step 3: PASSIVE 効果（両プレイヤーのカードを評価）。ステージも含める。
         for p in [player, opponent]:
-            for card in ([p.leader] if p.leader else []) + p.field + ([p.stage] if p.stage else []):
+            for card in tuple(p.iter_units()):
                 if not card or not card.master.abilities: continue
-                for ability in card.master.abilities:
-                    if ability.trigger == TriggerType.PASSIVE:
-                        if gm._is_reactive_passive(ability):
-                            continue  # 「…された時」型はイベント誘発であり再計算で実行しない
-                        gm.resolve_ability(p, ability, source_card=card)
+                for ability in card.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
+                    if gm._is_reactive_passive(ability):
+                        continue  # 「…された時」型はイベント誘発であり再計算で実行しない
+                    gm.resolve_ability(p, ability, source_card=card)
     finally:
         gm._in_passive_recalc = False
 
@@ -151,9 +152,7 @@ def _apply_hand_self_cost(gm, player: Player, opponent: Player):
         for card in p.hand:
             if not card or not card.master.abilities:
                 continue
-            for ability in card.master.abilities:
-                if ability.trigger != TriggerType.PASSIVE:
-                    continue
+            for ability in card.master.abilities_by_trigger.get(TriggerType.PASSIVE, ()):
                 eff = ability.effect
                 tq = getattr(eff, "target", None)
                 if (eff is None or getattr(eff, "status", None) != "COST_REDUCTION"
@@ -114,11 +114,10 @@ def _resolve_on_ko(gm, card: Card, owner: Player,
     # 他カードの「…キャラがKOされた時」リスナーを積む（自身の【KO時】とは独立）。
     gm._enqueue_ko_listeners(card, owner)
     if not card.master.abilities: return
-    for ability in card.master.abilities:
-        if ability.trigger == TriggerType.ON_KO:
-            if not gm._ko_trigger_matches(ability, owner, cause, effect_controller):
-                continue
-            gm.resolve_ability(owner, ability, source_card=card)
+    for ability in card.master.abilities_by_trigger.get(TriggerType.ON_KO, ()):
+        if not gm._ko_trigger_matches(ability, owner, cause, effect_controller):
+            continue
+        gm.resolve_ability(owner, ability, source_card=card)
 
 def _rest_subject_matches(gm, ability: Ability, rested_card: Card, host: Card,
                           host_owner: Player, by_attack: bool,
@@ -161,13 +160,10 @@ def _fire_on_rest_triggers(gm, rested_card: Card, by_attack: bool,
     発動可否・文脈（自分のターン中 等）・ターン1回は resolve_ability/_check_condition が評価する。"""
     pending = []
     for p in (gm.p1, gm.p2):
-        hosts = ([p.leader] if p.leader else []) + list(p.field)
-        for host in hosts:
-            if host is None or not host.master.abilities:
+        for host in p.iter_units(include_stage=False):
+            if not host.master.abilities:
                 continue
-            for ability in host.master.abilities:
-                if ability.trigger != TriggerType.ON_REST:
-                    continue
+            for ability in host.master.abilities_by_trigger.get(TriggerType.ON_REST, ()):
                 if gm._rest_subject_matches(ability, rested_card, host, p,
                                               by_attack=by_attack,
                                               effect_controller=effect_controller,
@@ -210,13 +206,10 @@ def _enqueue_on_leave(gm, leaving_card: Card, leaving_owner: Player) -> None:
     """キャラが場を離れた時(ON_LEAVE)の誘発を、両プレイヤーのリーダー/場から探して積む。
     主語フィルタ（側・特徴・名前）に一致する能力のみを対象とする（バギー OP16-041 等）。"""
     for owner in (gm.p1, gm.p2):
-        holders = ([owner.leader] if owner.leader else []) + list(owner.field)
-        for holder in holders:
+        for holder in owner.iter_units(include_stage=False):
             if holder is leaving_card:
                 continue
-            for ability in getattr(holder.master, "abilities", ()):
-                if ability.trigger != TriggerType.ON_LEAVE:
-                    continue
+            for ability in holder.master.abilities_by_trigger.get(TriggerType.ON_LEAVE, ()):
                 if not gm._leave_subject_matches(ability, leaving_card, owner, leaving_owner):
                     continue
                 optional = _nfc("発動できる") in _nfc(getattr(ability, "raw_text", "") or "")
@@ -263,8 +256,8 @@ def _played_subject_matches(gm, ability: Ability, holder_owner: Player,
         if key in pre and from_zone != zone:
             return False
     if _nfc("【トリガー】を持つ") in pre:
-        has_trig = bool(getattr(played_card.master, "trigger_text", "")) or any(
-            ab.trigger == TriggerType.TRIGGER for ab in (played_card.master.abilities or ()))
+        has_trig = bool(getattr(played_card.master, "trigger_text", "")) or (
+            TriggerType.TRIGGER in played_card.master.abilities_by_trigger)
         if not has_trig:
             return False
     traits = re.findall(r'[《<『]([^》>』]+)[》>』]', pre)
@@ -283,11 +276,8 @@ def _enqueue_char_played_listeners(gm, played_card: Card, played_owner: Player,
     if played_card.master.type != CardType.CHARACTER:
         return
     for owner in (gm.p1, gm.p2):
-        holders = ([owner.leader] if owner.leader else []) + list(owner.field)
-        if owner.stage:
-            holders.append(owner.stage)
-        for holder in holders:
-            if holder is None or holder is played_card:
+        for holder in owner.iter_units():
+            if holder is played_card:
                 continue
             for ability in (holder.master.abilities or ()):
                 if ability.trigger not in _CHAR_PLAYED_LISTENER_TRIGGERS:
@@ -342,15 +332,10 @@ def _enqueue_ko_listeners(gm, koed_card: Card, koed_owner: Player) -> None:
     """KO発生時に、両プレイヤーのリーダー/場/ステージから第三者KOリスナーを探して
     誘発待ち行列へ積む（KOされたカード自身の【KO時】は _resolve_on_ko の self 経路）。"""
     for owner in (gm.p1, gm.p2):
-        holders = ([owner.leader] if owner.leader else []) + list(owner.field)
-        if owner.stage:
-            holders.append(owner.stage)
-        for holder in holders:
-            if holder is None or holder is koed_card:
+        for holder in owner.iter_units():
+            if holder is koed_card:
                 continue
-            for ability in (holder.master.abilities or ()):
-                if ability.trigger != TriggerType.ON_KO:
-                    continue
+            for ability in holder.master.abilities_by_trigger.get(TriggerType.ON_KO, ()):
                 if not gm._ko_listener_matches(ability, owner, koed_card, koed_owner):
                     continue
                 optional = _nfc("発動できる") in _nfc(getattr(ability, "raw_text", "") or "")
@@ -367,11 +352,9 @@ def _enqueue_life_decrease(gm, player: Player, count: int = 1) -> None:
     効果内の Choice でプレイヤーが選ぶ。"""
     for _ in range(max(1, count)):
         for owner in (gm.p1, gm.p2):
-            cards = ([owner.leader] if owner.leader else []) + owner.field
-            for card in cards:
-                for ability in card.master.abilities:
-                    if ability.trigger == TriggerType.ON_LIFE_DECREASE:
-                        gm._enqueue_trigger(owner, ability, card, optional=False)
+            for card in owner.iter_units(include_stage=False):
+                for ability in card.master.abilities_by_trigger.get(TriggerType.ON_LIFE_DECREASE, ()):
+                    gm._enqueue_trigger(owner, ability, card, optional=False)
 
 def _fire_on_life_decrease(gm, player: Player, count: int = 1):
     """ライフ離脱の誘発を積んで即座に消化する（効果ダメージ等の単発経路用）。
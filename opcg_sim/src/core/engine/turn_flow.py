@@ -1,7 +1,6 @@
 """ゲーム開始・マリガン・ターン進行/フェイズ遷移（GameManager からの移管・第1引数 gm）。"""
 from __future__ import annotations
 
-import random
 import logging
 
 from ..journal import JournaledDict, JournaledList, JournaledSet
@@ -14,20 +13,19 @@ _logger = logging.getLogger("opcg.engine")
 
 def start_game(gm, first_player: Optional[Player] = None):
     
-    gm.p1.shuffle_deck()
-    gm.p2.shuffle_deck()
+    gm.p1.shuffle_deck(gm.rng)
+    gm.p2.shuffle_deck(gm.rng)
     
     for p in [gm.p1, gm.p2]:
         if p.leader:
-            for ability in p.leader.master.abilities:
-                if ability.trigger == TriggerType.GAME_START:
-                    gm.resolve_ability(p, ability, source_card=p.leader)
-                    
-                    if gm.active_interaction:
-                        gm.setup_phase_pending = True
-                        if first_player: gm.turn_player = first_player; gm.opponent = gm.p2 if first_player == gm.p1 else gm.p1
-                        else: gm.turn_player = gm.p1; gm.opponent = gm.p2
-                        return
+            for ability in p.leader.master.abilities_by_trigger.get(TriggerType.GAME_START, ()):
+                gm.resolve_ability(p, ability, source_card=p.leader)
+
+                if gm.active_interaction:
+                    gm.setup_phase_pending = True
+                    if first_player: gm.turn_player = first_player; gm.opponent = gm.p2 if first_player == gm.p1 else gm.p1
+                    else: gm.turn_player = gm.p1; gm.opponent = gm.p2
+                    return
 
     gm.finish_setup()
 
@@ -47,10 +45,8 @@ def do_mulligan(gm, player: 'Player') -> None:
     hand_count = len(player.hand)
     player.deck.extend(player.hand)
     player.hand.clear()
-    random.shuffle(player.deck)
-    for _ in range(5):
-        if player.deck:
-            player.hand.append(player.deck.pop(0))
+    player.shuffle_deck(gm.rng)
+    player._deal_from_deck(player.hand, 5)
     gm.mulligan_done.add(player.name)
     gm._check_mulligan_complete()
 
@@ -87,24 +83,26 @@ def end_turn(gm):
 def _fire_turn_end_triggers(gm):
     """ターン終了時トリガーを発火する。ターンプレイヤーの【自分のターン終了時】
     (TURN_END) と、非ターンプレイヤーの【相手のターン終了時】(OPP_TURN_END)。"""
-    def _units(pl):
-        us = [pl.leader] + pl.field
-        if pl.stage: us.append(pl.stage)
-        return us
     for pl, trig in ((gm.turn_player, TriggerType.TURN_END),
                      (gm.opponent, TriggerType.OPP_TURN_END)):
-        for card in _units(pl):
-            if card and card.master.abilities:
-                for ability in card.master.abilities:
-                    if ability.trigger == trig:
-                        # 先行トリガーが確認/選択で中断中は即時解決できない（resolver は
-                        # 中断中1ステップも実行せず return し、能力が無言で消える）。
-                        # コスト付きターン終了時は使用確認(CONFIRM_OPTIONAL)で中断するのが
-                        # 常態のため、中断中は誘発待ち行列へ積み、対話完了時に消化する。
-                        if gm.active_interaction:
-                            gm._enqueue_trigger(pl, ability, card, optional=False)
-                        else:
-                            gm.resolve_ability(pl, ability, source_card=card)
+        # 能力の解決で場が動く（KO・手札に戻す等）ため、走査前の顔ぶれを list で固定する。
+        # 固定するのは該当トリガーを持つユニットだけ（大半のターンは空 list で済む）。
+        # 能力タプルも走査時に一緒に取り出し、解決ループで引き直さない。
+        holders = []
+        for c in pl.iter_units():
+            abilities = c.master.abilities_by_trigger.get(trig)
+            if abilities:
+                holders.append((c, abilities))
+        for card, abilities in holders:
+            for ability in abilities:
+                # 先行トリガーが確認/選択で中断中は即時解決できない（resolver は
+                # 中断中1ステップも実行せず return し、能力が無言で消える）。
+                # コスト付きターン終了時は使用確認(CONFIRM_OPTIONAL)で中断するのが
+                # 常態のため、中断中は誘発待ち行列へ積み、対話完了時に消化する。
+                if gm.active_interaction:
+                    gm._enqueue_trigger(pl, ability, card, optional=False)
+                else:
+                    gm.resolve_ability(pl, ability, source_card=card)
 
 def _flush_pending_end_of_turn(gm):
     """end_turn フックで、予約された遅延アクション（このターン終了時、〜）を解決する。"""
@@ -175,15 +173,11 @@ def _fire_turn_start_triggers(gm):
     CONFIRM_TRIGGER の確認を挟む（_advance_pending_triggers が処理）。確認・効果解決の
     対話はリフレッシュ/ドロー/ドン!!展開の完了後（アクション境界/対話完了時）に立つ。"""
     pl = gm.turn_player
-    units = [pl.leader] + list(pl.field)
-    if pl.stage:
-        units.append(pl.stage)
-    for card in units:
-        if not card or not card.master.abilities:
+    # 条件判定と誘発待ち行列への積み込みだけで場は動かないため、ユニットを直接走査する。
+    for card in pl.iter_units():
+        if not card.master.abilities:
             continue
-        for ability in card.master.abilities:
-            if ability.trigger != TriggerType.TURN_START:
-                continue
+        for ability in card.master.abilities_by_trigger.get(TriggerType.TURN_START, ()):
             if ability.condition is not None:
                 try:
                     if not EffectResolver(gm)._check_condition(pl, ability.condition, card):
@@ -197,53 +191,71 @@ def _fire_turn_start_triggers(gm):
 def refresh_phase(gm):
     gm._reset_player_status(gm.opponent); gm.refresh_all(gm.turn_player); gm.draw_phase()
 
+def _refresh_units(gm, player: Player, clear_rest: bool):
+    """ユニット（リーダー/場のキャラ/ステージ）のターン境界リセットを1パスで行う。
+    clear_rest=True（リフレッシュフェイズの持ち主）はレストも戻し付与ドン!!も外す。
+    clear_rest=False（直前のターンプレイヤー）は一時効果だけ解除し付与ドン!!は残す。"""
+    for card in player.iter_units():
+        # フリーズ（flags の "FREEZE"）は reset_turn_status で消えるため先に判定する。
+        # 既にアクティブなカードへは書き込まない（探索中は属性書き込みごとに journal へ
+        # 旧値が積まれ、再計算の dirty-flag も進むため、値の変わらない代入を省く）。
+        unrest = clear_rest and card.is_rest and "FREEZE" not in card.flags
+        # ターン境界のリセット。【ターン1回】の使用回数もここで戻す。
+        card.reset_turn_status(keep_don=not clear_rest, clear_usage=True)
+        if unrest: card.is_rest = False
+
 def _reset_player_status(gm, player: Player):
     # 相手ターン開始時に直前のターンプレイヤー(=現opponent)の一時効果を解除するが、
     # 付与ドン!!は剥がさない（持ち主の次のリフレッシュフェイズまでカードに残る）。
-    all_units = [player.leader] + player.field
-    if player.stage: all_units.append(player.stage)
-    for card in all_units:
-        # ターン境界のリセット。【ターン1回】の使用回数もここで戻す。
-        if card: card.reset_turn_status(keep_don=True, clear_usage=True)
+    _refresh_units(gm, player, clear_rest=False)
 
 def refresh_all(gm, player: Player):
-    all_units = [player.leader] + player.field
-    if player.stage: all_units.append(player.stage)
-    for card in all_units:
-        if card:
-            is_frozen = "FREEZE" in card.flags
-            # ターン境界のリセット。【ターン1回】の使用回数もここで戻す。
-            card.reset_turn_status(clear_usage=True)
-            if not is_frozen: card.is_rest = False
+    _refresh_units(gm, player, clear_rest=True)
     
     # フリーズ中のドン!!（FREEZE_DON / OP07-026）は今回のリフレッシュではアクティブに
     # 戻さず、レストのまま据え置いてフラグを下ろす（1回限りのフリーズ）。
-    still_frozen, to_activate = [], []
-    for don in player.don_rested:
-        if don.is_frozen:
-            don.is_frozen = False
-            still_frozen.append(don)
-        else:
+    # ゾーン list は作り直さず中身を入れ替える（空 list の新規確保と旧 list の破棄を省く）。
+    # スライス代入/clear も JournaledList が記録するので make/unmake の巻き戻しは従来どおり。
+    rested = player.don_rested
+    if rested and not any(don.is_frozen for don in rested):
+        # 通常はフリーズ中のドン!!が無い: 振り分け用の一時 list を作らず、レスト領域を丸ごと移す。
+        for don in rested:
             don.is_rest = False
-            to_activate.append(don)
-    player.don_active.extend(to_activate)
-    player.don_rested = JournaledList(still_frozen)
+        player.don_active.extend(rested)
+        rested.clear()
+    elif rested:
+        still_frozen, to_activate = [], []
+        for don in rested:
+            if don.is_frozen:
+                don.is_frozen = False
+                still_frozen.append(don)
+            else:
+                don.is_rest = False
+                to_activate.append(don)
+        player.don_active.extend(to_activate)
+        rested[:] = still_frozen
     
-    for don in player.don_attached_cards:
-        don.is_rest = False
-        don.attached_to = None
-        player.don_active.append(don)
-    player.don_attached_cards = JournaledList()
+    # 付与中のドン!!は状態だけ戻し、アクティブ領域へは1回の extend でまとめて移す。
+    attached = player.don_attached_cards
+    if attached:
+        for don in attached:
+            don.is_rest = False
+            don.attached_to = None
+        player.don_active.extend(attached)
+        attached.clear()
 
 def draw_phase(gm):
     if gm.turn_count > 1: gm.draw_card(gm.turn_player)
     gm.don_phase()
 
 def don_phase(gm):
+    # 先攻1ターン目は1枚、以降は2枚（ドン!!デッキの残数まで）。先頭スライスで一括移動する。
     cards_to_add = 1 if gm.turn_count == 1 else 2
-    for _ in range(cards_to_add):
-        if gm.turn_player.don_deck:
-            don = gm.turn_player.don_deck.pop(0); gm.turn_player.don_active.append(don)
+    tp = gm.turn_player
+    added = tp.don_deck[:cards_to_add]
+    if added:
+        del tp.don_deck[:cards_to_add]
+        tp.don_active.extend(added)
     gm.main_phase()
 
 def main_phase(gm): 
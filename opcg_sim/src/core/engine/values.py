@@ -6,15 +6,19 @@ from ..effects.matcher import get_target_cards
 
 def get_dynamic_value(gm, player: Player, val_source: ValueSource, targets: List[CardInstance], context: Dict) -> int:
     if not val_source: return 0
-    if val_source.dynamic_source == "COUNT_REFERENCE":
+    # 大半は固定値（dynamic_source=None）なので最初に返す。種別は1回だけ読んで局所変数で分岐する。
+    source = val_source.dynamic_source
+    if source is None:
+        return val_source.base
+    if source == "COUNT_REFERENCE":
         return len(player.trash)
     # 文脈依存「直前アクションで捨てた/戻した/KOした…カードN枚につき」（§7-5）。
     # 生の枚数を返す（divisor/multiplier は _calculate_value が適用する）。
-    if val_source.dynamic_source == "PREV_ACTION_COUNT":
+    if source == "PREV_ACTION_COUNT":
         return int((context or {}).get("_last_action_count", 0) or 0)
     # 「<範囲>N枚につき」の汎用カウント（RC-4）。範囲クエリを毎回実体化して数える
     # （PASSIVE 再計算で盤面に追随する）。
-    if val_source.dynamic_source == "COUNT_QUERY" and getattr(val_source, "count_query", None) is not None:
+    if source == "COUNT_QUERY" and getattr(val_source, "count_query", None) is not None:
         src = None
         src_uuid = (context or {}).get("_source_card_uuid")
         if src_uuid:
@@ -25,7 +29,7 @@ def get_dynamic_value(gm, player: Player, val_source: ValueSource, targets: List
         return n
     # C9「（相手のリーダー／選んだキャラ／アタックしているキャラ）と同じパワーになる」。
     # 発動時スナップショット: 参照カードの現在パワーを固定値として返す（以後の変動に追随しない）。
-    if val_source.dynamic_source == "REFERENCE_POWER":
+    if source == "REFERENCE_POWER":
         ref = gm._resolve_power_reference(player, val_source.ref_id, context)
         if ref is None:
             return val_source.base
@@ -33,7 +37,7 @@ def get_dynamic_value(gm, player: Player, val_source: ValueSource, targets: List
         is_ref_turn = bool(ref_owner) and ref_owner.name == gm.turn_player.name
         return ref.get_power(is_ref_turn)
     # 「元々のパワーと同じ」: 参照カードの基礎値（master.power）を写す（バフ非追随）
-    if val_source.dynamic_source == "REFERENCE_BASE_POWER":
+    if source == "REFERENCE_BASE_POWER":
         ref = gm._resolve_power_reference(player, val_source.ref_id, context)
         if ref is None:
             return val_source.base
@@ -1,4 +1,5 @@
 from typing import List, Optional, Any, Tuple, Dict, Set
+import copy
 import random
 import re
 from ..models.models import CardInstance, DonInstance, CONST
@@ -17,6 +18,21 @@ from .engine import card_moves as _card_moves, passives as _passives
 
 Card = CardInstance
 
+# Player.to_dict の出力キー（shared_constants.PLAYER_PROPERTIES）。CONST は再読込されないため
+# 読込時に1回だけ解決する（状態送信のたびの .get 連鎖を避ける）。
+_PLAYER_PROPS = CONST.get('PLAYER_PROPERTIES', {})
+_PK_LIFE_COUNT = _PLAYER_PROPS.get("LIFE_COUNT", "life_count")
+_PK_DON_DECK_COUNT = _PLAYER_PROPS.get("DON_DECK_COUNT", "don_deck_count")
+_PK_DON_ACTIVE = _PLAYER_PROPS.get("DON_ACTIVE", "don_active")
+_PK_DON_RESTED = _PLAYER_PROPS.get("DON_RESTED", "don_rested")
+
+# 合法手列挙/プレイ判定で毎回引くカード種別。Python 3.11 の Enum メンバー参照（CardType.X）は
+# クラス属性の記述子経由で素の名前参照の十数倍重いため、ホットパス用にモジュール定数へ束縛する。
+_TYPE_CHARACTER = CardType.CHARACTER
+_TYPE_EVENT = CardType.EVENT
+# イベントを手札から発動したとき解決する【メイン】相当のトリガー。
+_EVENT_MAIN_TRIGGERS = (TriggerType.ON_PLAY, TriggerType.ACTIVATE_MAIN)
+
 # 場のキャラクター上限（公式ルール）。ステージ(owner.stage)・ドン!!は含まない。
 # 6体目を登場させた場合は自分のキャラ1体を選んでトラッシュして5体に戻す（強制トラッシュ）。
 
@@ -71,64 +87,72 @@ class Player:
         # 場に残らない発生源（イベント＝即トラッシュ）の置換を、被除去キャラ側から参照するため。
         self.granted_replacements: List[Dict[str, Any]] = JournaledList()
 
-    def setup_game(self):
-        random.shuffle(self.deck)
+    def iter_units(self, include_stage: bool = True):
+        """場のユニット（リーダー → 場のキャラ → ステージ）を順に返す。空のリーダー/ステージは飛ばす。
+        `[leader] + field (+ [stage])` のリスト連結を毎回作らずに走査するためのジェネレータ。
+        include_stage=False はリーダーと場のキャラだけ（ステージを持ち得ない誘発の探索用）。
+        field を直接走査するので、走査中に場を動かす処理（効果解決等）では list() で固定すること。"""
         if self.leader:
-            life_count = self.leader.master.life
-            for _ in range(life_count):
-                if self.deck:
-                    self.life.append(self.deck.pop(0))
-        for _ in range(5):
-            if self.deck:
-                self.hand.append(self.deck.pop(0))
+            yield self.leader
+        yield from self.field
+        if include_stage and self.stage:
+            yield self.stage
 
-    def shuffle_deck(self):
-        random.shuffle(self.deck)
+    def setup_game(self, rng: Optional[random.Random] = None):
+        self.shuffle_deck(rng)
+        if self.leader:
+            self._deal_from_deck(self.life, self.leader.master.life)
+        self._deal_from_deck(self.hand, 5)
+
+    def shuffle_deck(self, rng: Optional[random.Random] = None):
+        """デッキを混ぜる。JournaledList を直接 random.shuffle すると交換1回ごとに
+        __setitem__（journal の判定込み）を Python レベルで2回呼ぶため、素の list で混ぜてから
+        スライス代入で1回だけ書き戻す。乱数の消費は同じなので同一シードで同じ並びになる。
+        rng（GameManager.rng）を渡すとその乱数列で混ぜる。None ならモジュール random。"""
+        cards = list(self.deck)
+        (rng or random).shuffle(cards)
+        self.deck[:] = cards
+
+    def _deal_from_deck(self, dest: List[Any], count: int) -> None:
+        """デッキの上から最大 count 枚を順序どおり dest の末尾へ移す。
+        pop(0) の逐次ループは1枚ごとに残り全体を詰め直す（O(count·N)）ため、先頭スライスを
+        まとめて切り出す。deque 化はゾーンが JournaledList（make/unmake の差分記録）である
+        前提と両立しないので、list のまま一括移動で先頭操作の回数を減らす。"""
+        if count <= 0:
+            return
+        moved = self.deck[:count]
+        del self.deck[:count]
+        dest.extend(moved)
 
     def place_life(self):
         if self.leader:
-            life_count = self.leader.master.life
-            for _ in range(life_count):
-                if self.deck:
-                    self.life.append(self.deck.pop(0))
+            self._deal_from_deck(self.life, self.leader.master.life)
 
     def draw_initial_hand(self):
-        for _ in range(5):
-            if self.deck:
-                self.hand.append(self.deck.pop(0))
+        self._deal_from_deck(self.hand, 5)
 
     def to_dict(self, is_owner: bool = True, is_my_turn: bool = True):
-        player_props = CONST.get('PLAYER_PROPERTIES', {})
-        leader_dict = self.leader.to_dict(is_my_turn) if self.leader else None
-        if leader_dict:
-            leader_dict["is_face_up"] = True
-        stage_dict = self.stage.to_dict(is_my_turn) if self.stage else None
-        if stage_dict:
-            stage_dict["is_face_up"] = True
+        leader_dict = self.leader.to_dict(is_my_turn, face_up=True) if self.leader else None
+        stage_dict = self.stage.to_dict(is_my_turn, face_up=True) if self.stage else None
         return {
             "player_id": self.name,
             "name": self.name,
-            player_props.get("LIFE_COUNT", "life_count"): len(self.life),
+            _PK_LIFE_COUNT: len(self.life),
             "hand_count": len(self.hand),
-            player_props.get("DON_DECK_COUNT", "don_deck_count"): len(self.don_deck),
-            player_props.get("DON_ACTIVE", "don_active"): [d.to_dict() for d in self.don_active],
-            player_props.get("DON_RESTED", "don_rested"): [d.to_dict() for d in self.don_rested],
+            _PK_DON_DECK_COUNT: len(self.don_deck),
+            _PK_DON_ACTIVE: [d.to_dict() for d in self.don_active],
+            _PK_DON_RESTED: [d.to_dict() for d in self.don_rested],
             "leader": leader_dict,
             "stage": stage_dict,
             "zones": {
-                "field": [self._format_card(c, True, is_my_turn) for c in self.field],
-                "hand": [self._format_card(c, is_owner, is_my_turn) for c in self.hand],
-                "life": [self._format_card(c, c.is_face_up, is_my_turn) for c in self.life],
-                "trash": [self._format_card(c, True, is_my_turn) for c in self.trash],
+                "field": [c.to_dict(is_my_turn, face_up=True) for c in self.field],
+                "hand": [c.to_dict(is_my_turn, face_up=is_owner) for c in self.hand],
+                "life": [c.to_dict(is_my_turn) for c in self.life],  # 表裏はカード自身の is_face_up
+                "trash": [c.to_dict(is_my_turn, face_up=True) for c in self.trash],
                 "stage": stage_dict
             }
         }
 
-    def _format_card(self, card: Card, face_up: bool, is_my_turn: bool = True) -> dict:
-        d = card.to_dict(is_my_turn)
-        d["is_face_up"] = face_up
-        return d
-
 class GameManager:
     def __setattr__(self, name, value):
         # 差分巻き戻し（journal.transaction 中のみ記録）。object.__setattr__ 経由なので
@@ -137,9 +161,13 @@ class GameManager:
             record_attr(self, name, self.__dict__)
         object.__setattr__(self, name, value)
 
-    def __init__(self, player1: Player, player2: Player):
+    def __init__(self, player1: Player, player2: Player, rng: Optional[random.Random] = None):
         self.p1 = player1
         self.p2 = player2
+        # シャッフル用の乱数源。None は従来どおりモジュール random（グローバル状態）を使う。
+        # 対局ごとに random.Random(seed) を渡すと、他の対局/探索の乱数消費に左右されない
+        # 再現可能なデッキ順になる（バグ再現・AI 実験用）。
+        self.rng = rng
         self.turn_player = self.p1
         self.opponent = self.p2
         # リーダーの「ルール上、自分のドン!!デッキはN枚になる」(OP15-058 エネル等) を適用する。
@@ -151,6 +179,9 @@ class GameManager:
         # Phase2: 継続効果再計算（_apply_passive_effects）の dirty-flag。最後に再計算したときの
         # journal._mut_count を保持し、探索中(make/unmake)に入力不変なら再計算を省く。-1=未計算。
         self._passive_mc = -1
+        # カードの所在ヒント（uuid → (Player, ゾーン属性名)）。_find_card_location が検証してから
+        # 使う推測値で、盤面状態ではない（journal で巻き戻さず、deep_diff の比較対象外）。
+        self._loc_hint: Dict[str, Tuple[Player, Optional[str]]] = {}
         # このターン中に発生したイベントの回数（EVENT_THIS_TURN 条件用）。ターン開始でクリア。
         # 例: "DON_RETURNED"（ドン!!デッキへ返却）/ "CHAR_LEFT_BY_OWN_EFFECT" / "NAVY_DISCARD" /
         #     "TRIGGER_CHAR_PLAYED"。各イベント発生地点で record_turn_event() を呼ぶ。
@@ -258,7 +289,6 @@ class GameManager:
         一時バッファ（action_events）はコピー後にリセットする。
         本体（self）は一切変化させない（docs/SPEC.md §2.5.2）。
         """
-        import copy
         snapshot = copy.deepcopy(self)
         snapshot.action_events = JournaledList()
         return snapshot
@@ -279,14 +309,14 @@ class GameManager:
         pending = self.get_pending_request(with_request_id=False)  # 合法手列挙は request_id を読まない
         if not pending:
             return []
-        pending_props = CONST.get('PENDING_REQUEST_PROPERTIES', {})
-        KEY_PID = pending_props.get('PLAYER_ID', 'player_id')
-        KEY_ACTION = pending_props.get('ACTION', 'action')
-        battle_actions = CONST.get('c_to_s_interface', {}).get('BATTLE_ACTIONS', {}).get('TYPES', {})
-        ACT_BLOCKER = battle_actions.get('SELECT_BLOCKER', 'SELECT_BLOCKER')
-        ACT_COUNTER = battle_actions.get('SELECT_COUNTER', 'SELECT_COUNTER')
-        ACT_PASS = battle_actions.get('PASS', 'PASS')
-        RESOLVE = CONST.get('c_to_s_interface', {}).get('GAME_ACTIONS', {}).get('TYPES', {}).get('RESOLVE_EFFECT_SELECTION', 'RESOLVE_EFFECT_SELECTION')
+        # 共有定数キー/アクション種別は interaction モジュールで読込時に解決済み。
+        KEY_PID = _interaction._KEY_PID
+        KEY_ACTION = _interaction._KEY_ACTION
+        KEY_UUIDS = _interaction._KEY_UUIDS
+        ACT_BLOCKER = _interaction._ACT_BLOCKER
+        ACT_COUNTER = _interaction._ACT_COUNTER
+        ACT_PASS = _interaction._ACT_PASS
+        RESOLVE = _interaction._RESOLVE_SELECTION
 
         req_pid = pending[KEY_PID]
         # player 未指定なら要求先プレイヤーを行動主体とする。
@@ -305,13 +335,13 @@ class GameManager:
             return moves
 
         if action == ACT_BLOCKER:
-            for uid in pending.get(pending_props.get('SELECTABLE_UUIDS', 'selectable_uuids'), []):
+            for uid in pending.get(KEY_UUIDS, []):
                 moves.append({"kind": "battle", "action_type": ACT_BLOCKER, "card_uuid": uid})
             moves.append({"kind": "battle", "action_type": ACT_PASS, "card_uuid": None})
             return moves
 
         if action == ACT_COUNTER:
-            for uid in pending.get(pending_props.get('SELECTABLE_UUIDS', 'selectable_uuids'), []):
+            for uid in pending.get(KEY_UUIDS, []):
                 moves.append({"kind": "battle", "action_type": ACT_COUNTER, "card_uuid": uid})
             moves.append({"kind": "battle", "action_type": ACT_PASS, "card_uuid": None})
             return moves
@@ -328,9 +358,9 @@ class GameManager:
                 if cannot_play_hand:
                     continue
                 # 【メイン】効果を持たないイベント（カウンター/トリガー専用）はメインで発動不可。
-                if c.master.type == CardType.EVENT and not self._event_has_main_play(c):
+                if c.master.type == _TYPE_EVENT and not self._event_has_main_play(c):
                     continue
-                if c.master.type == CardType.CHARACTER and char_rec is not None:
+                if c.master.type == _TYPE_CHARACTER and char_rec is not None:
                     min_cost = char_rec.get("min_cost")
                     if min_cost is None or (c.master.cost is not None and c.master.cost >= min_cost):
                         continue  # この制限下では登場できないキャラ
@@ -345,7 +375,7 @@ class GameManager:
                 for c in player.field:
                     if c.is_rest:
                         continue
-                    if (c.master.type == CardType.CHARACTER and c.is_newly_played
+                    if (c.master.type == _TYPE_CHARACTER and c.is_newly_played
                             and not c.has_keyword("速攻")):
                         continue
                     if "ATTACK_DISABLE" in c.flags or "ATTACK_DISABLE" in c.timed_flags:
@@ -371,11 +401,9 @@ class GameManager:
             # 「撃っても何も起きない no-op 起動メイン」を CPU 探索/プレイヤー双方から除外できる
             # （従来はコスト/回数を見ずに列挙していたため、CPU が同一ステージの起動メインを
             #   連打して 1 ターンを空費していた）。
-            units = ([player.leader] if player.leader else []) + list(player.field)
-            if player.stage:
-                units.append(player.stage)
+            # 判定のみで場は動かさないので、ユニットを list に組まず直接走査する。
             _am_resolver = EffectResolver(self)
-            for c in units:
+            for c in player.iter_units():
                 if c.is_effect_negated or getattr(c, "negated", False):
                     continue
                 if self._has_activatable_main(c, player, _am_resolver):
@@ -403,9 +431,7 @@ class GameManager:
         """
         if resolver is None:
             resolver = EffectResolver(self)
-        for ab in card.master.abilities:
-            if ab.trigger != TriggerType.ACTIVATE_MAIN:
-                continue
+        for ab in card.master.abilities_by_trigger.get(TriggerType.ACTIVATE_MAIN, ()):
             if ab.condition is not None and not resolver._check_condition(player, ab.condition, card):
                 continue
             lim = _condition_turn_limit(getattr(ab, "condition", None))
@@ -441,25 +467,17 @@ class GameManager:
         return _card_moves._suspend_for_field_overflow(self, owner)
 
     def _validate_action(self, player: Player, action_type: str):
-        pending = self.get_pending_request(with_request_id=False)  # 検証は request_id を読まない
-        if not pending: raise ValueError("現在実行可能なアクションはありません。")
-        
-        pending_props = CONST.get('PENDING_REQUEST_PROPERTIES', {})
-        KEY_PID = pending_props.get('PLAYER_ID', 'player_id')
-        KEY_ACTION = pending_props.get('ACTION', 'action')
-        
-        battle_actions = CONST.get('c_to_s_interface', {}).get('BATTLE_ACTIONS', {}).get('TYPES', {})
-        ACT_BLOCKER = battle_actions.get('SELECT_BLOCKER', 'SELECT_BLOCKER')
-        ACT_COUNTER = battle_actions.get('SELECT_COUNTER', 'SELECT_COUNTER')
-        ACT_PASS = battle_actions.get('PASS', 'PASS')
-        RESOLVE_SELECTION = CONST.get('c_to_s_interface', {}).get('GAME_ACTIONS', {}).get('TYPES', {}).get('RESOLVE_EFFECT_SELECTION', 'RESOLVE_EFFECT_SELECTION')
-        
-        if pending[KEY_PID] != player.name: raise ValueError(f"現在は {pending[KEY_PID]} のターン/フェイズです。")
-        
-        expected_action = pending[KEY_ACTION]
-        if expected_action in [ACT_COUNTER, ACT_BLOCKER] and action_type == ACT_PASS: return True
-        if self.active_interaction and action_type == RESOLVE_SELECTION: return True
-        
+        # 検証に要るのは (player_id, action) だけなので、selectable 構築や候補 to_dict を伴う
+        # get_pending_request ではなく pending_actor_action を引く（判定・副作用は一致）。
+        pa = _interaction.pending_actor_action(self)
+        if not pa: raise ValueError("現在実行可能なアクションはありません。")
+        expected_pid, expected_action = pa
+
+        if expected_pid != player.name: raise ValueError(f"現在は {expected_pid} のターン/フェイズです。")
+
+        if (expected_action == _interaction._ACT_COUNTER or expected_action == _interaction._ACT_BLOCKER) and action_type == _interaction._ACT_PASS: return True
+        if self.active_interaction and action_type == _interaction._RESOLVE_SELECTION: return True
+
         if expected_action != action_type:
             raise ValueError(f"不適切なアクションです。期待されているアクション: {expected_action}")
         return True
@@ -608,16 +626,19 @@ class GameManager:
         """イベントがメインフェイズに手札から発動できるか＝【メイン】効果
         （ON_PLAY/ACTIVATE_MAIN トリガー）を1つ以上持つか。【カウンター】/【トリガー】
         のみのイベントは False（メインでは発動不可）。"""
-        return any(ab.trigger in (TriggerType.ON_PLAY, TriggerType.ACTIVATE_MAIN)
-                   for ab in (card.master.abilities or ()))
+        by_trigger = card.master.abilities_by_trigger
+        return TriggerType.ON_PLAY in by_trigger or TriggerType.ACTIVATE_MAIN in by_trigger
 
     def play_card_action(self, player: Player, card: Card):
+        # 手札判定は list の `in` のままにする。CardInstance は eq=False（同一性比較）なので
+        # 1要素あたりポインタ比較のみで、手札は高々十数枚。uuid 集合を別途持つと、手札を直接
+        # 書き換える効果処理/テストの全経路で同期が要り、make/unmake の巻き戻し対象も増える。
         if card not in player.hand: return
         self._validate_action(player, "MAIN_ACTION")
         # 自己制限（self_cannot）: 「手札からカードをプレイできない」「キャラ（コストN以上）を登場できない」。
         if self._active_restriction(player, "CANNOT_PLAY_FROM_HAND"):
             raise ValueError("効果により、このターンは手札からカードをプレイできません。")
-        if card.master.type == CardType.CHARACTER:
+        if card.master.type == _TYPE_CHARACTER:
             char_rec = self._active_restriction(player, "CANNOT_PLAY_CHARACTER")
             if char_rec is not None:
                 min_cost = char_rec.get("min_cost")
@@ -625,7 +646,7 @@ class GameManager:
                 if min_cost is None or (card.master.cost is not None and card.master.cost >= min_cost):
                     suffix = f"コスト{min_cost}以上の" if min_cost else ""
                     raise ValueError(f"効果により、このターンは{suffix}キャラを登場できません。")
-        if card.master.type == CardType.EVENT:
+        if card.master.type == _TYPE_EVENT:
             # 【メイン】効果を持たないイベント（【カウンター】/【トリガー】のみ）は
             # メインフェイズに手札から発動できない（カウンターは防御時の SELECT_COUNTER、
             # トリガーはライフ公開時のみ）。従来はコストさえ払えれば列挙・実行され、
@@ -633,16 +654,18 @@ class GameManager:
             if not self._event_has_main_play(card):
                 raise ValueError("このイベントはメインフェイズに発動できません（【メイン】効果を持ちません）。")
             self._record_event_played(card)   # 「このターン中…イベントを発動」条件用（OP15-002）
+            # ON_PLAY と ACTIVATE_MAIN をカード記載順のまま解決するため、ここはトリガー別バケットに
+            # 分けず abilities を1回なめる（バケット2つの連結だと記載順が崩れる）。
             for ability in card.master.abilities:
-                if ability.trigger in [TriggerType.ON_PLAY, TriggerType.ACTIVATE_MAIN]:
+                if ability.trigger in _EVENT_MAIN_TRIGGERS:
                     self.resolve_ability(player, ability, source_card=card)
             self.move_card(card, Zone.TRASH, player)
         else:
             self.move_card(card, Zone.FIELD, player); card.attached_don = 0; card.is_newly_played = True
             # 【トリガー】を持つキャラの登場をターン内イベントとして記録（OP13-100「自分の【トリガー】を
             # 持つキャラが登場した時」）。trigger_text 非空 または TriggerType.TRIGGER 能力を持つ。
-            if (getattr(card.master, "trigger_text", "") or any(
-                    ab.trigger == TriggerType.TRIGGER for ab in (card.master.abilities or ()))):
+            if (getattr(card.master, "trigger_text", "")
+                    or TriggerType.TRIGGER in card.master.abilities_by_trigger):
                 self.record_turn_event("TRIGGER_CHAR_PLAYED", 1)
             # 登場した時点で継続効果（PASSIVE/YOUR_TURN）を適用してから ON_PLAY を解決する。
             # 例: クザン「相手のキャラすべてをコスト-5」+【登場時】コスト0のキャラをKO —
@@ -659,12 +682,11 @@ class GameManager:
             if onplay_negated:
                 pass
             if not card.is_effect_negated and not onplay_negated:
-                for ability in card.master.abilities:
-                    if ability.trigger == TriggerType.ON_PLAY:
-                        if self.active_interaction:
-                            self._enqueue_trigger(player, ability, card, optional=False)
-                        else:
-                            self.resolve_ability(player, ability, source_card=card)
+                for ability in card.master.abilities_by_trigger.get(TriggerType.ON_PLAY, ()):
+                    if self.active_interaction:
+                        self._enqueue_trigger(player, ability, card, optional=False)
+                    else:
+                        self.resolve_ability(player, ability, source_card=card)
             # 他カードの「…が登場した時」リスナー（OP14-041 等）。登場時無効(OPP_ONPLAY)は
             # 登場カード自身の【登場時】のみを無効にするため、リスナーは無効化に関わらず積む。
             self._enqueue_char_played_listeners(card, player, from_zone="HAND")
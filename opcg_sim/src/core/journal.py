@@ -277,6 +277,10 @@ class JournaledDict(dict):
 
 
 # --- 検証ユーティリティ（テスト専用。production 経路では使わない）-------------
+# deep_diff が比較しない属性（ロールバックしないキャッシュ類。GameManager が持つ）。
+_NON_STATE_ATTRS = frozenset({"_passive_mc", "_loc_hint"})
+
+
 def deep_diff(a, b, _path="", _seen=None):
     """2 つの状態を再帰比較し、最初の相違パス（str）を返す。一致なら None。
 
@@ -327,13 +331,13 @@ def deep_diff(a, b, _path="", _seen=None):
         return None if a == b else f"{_path}: {a!r} != {b!r}"
     if type(a).__name__ != type(b).__name__:
         return f"{_path}: type {type(a).__name__} != {type(b).__name__}"
-    # `_passive_mc`（Phase2・継続効果再計算の dirty-flag キャッシュ）はロールバック対象外
-    # （object.__setattr__ で更新・盤面状態でない）。両者から除外して比較する。
-    if (da.keys() - {"_passive_mc"}) != (db.keys() - {"_passive_mc"}):
+    # `_passive_mc`（Phase2・継続効果再計算の dirty-flag キャッシュ）と `_loc_hint`（検証付きの
+    # カード所在ヒント）はロールバック対象外（盤面状態でない）。両者から除外して比較する。
+    if (da.keys() - _NON_STATE_ATTRS) != (db.keys() - _NON_STATE_ATTRS):
         return f"{_path}: attrs {set(da) ^ set(db)} differ"
     for k in da:   # 挿入順（決定的）で反復
-        if k == "_passive_mc":
-            continue   # dirty-flag キャッシュは盤面状態でない＝比較対象外
+        if k in _NON_STATE_ATTRS:
+            continue   # キャッシュ類は盤面状態でない＝比較対象外
         if k == "gm" or k.startswith("__"):   # 後方参照はサイクル管理に任せる
             pass
         d = deep_diff(da[k], db[k], f"{_path}.{k}", _seen)
@@ -6,8 +6,12 @@ from .enums import (
     CompareOperator, ConditionType
 )
 import unicodedata
+from functools import lru_cache
 
+@lru_cache(maxsize=4096)
 def _nfc(text: str) -> str:
+    # 共有の NFC 正規化（engine._helpers・effects.rules.base もこれを使う）。matcher・誘発判定・
+    # ルール照合が同じカード名/語句を繰り返し正規化するため、結果をメモ化する（文字列は不変）。
     if not text: return ""
     return unicodedata.normalize('NFC', text)
 
@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional, Any, Set, Dict, Tuple
 import uuid
 import os
 import json
 import copy as _copy
-from .enums import CardType, Color, Attribute, ActionType, Phase, Player
+from .enums import CardType, Color, Attribute, Phase, Player, TriggerType
 from .effect_types import Ability
 from ..core import journal
 from ..core.journal import JournaledSet, JournaledDict, record_attr
@@ -13,6 +14,27 @@ from ..utils.shared_constants import load_shared_constants, FALLBACK_CONSTANTS
 # 共有定数はローダ一本化（utils/shared_constants.py）。読めなければ従来どおり最小フォールバック。
 CONST = load_shared_constants() or dict(FALLBACK_CONSTANTS)
 
+# UI 送信用のカード辞書キー（CONST は起動時に1度だけ読むため、キー名もここで確定させる）。
+_PROPS = CONST.get('CARD_PROPERTIES', {})
+_K_UUID = _PROPS.get('UUID', 'uuid')
+_K_CARD_ID = _PROPS.get('CARD_ID', 'card_id')
+_K_NAME = _PROPS.get('NAME', 'name')
+_K_POWER = _PROPS.get('POWER', 'power')
+_K_COUNTER = _PROPS.get('COUNTER', 'counter')
+_K_ATTRIBUTE = _PROPS.get('ATTRIBUTE', 'attribute')
+_K_COST = _PROPS.get('COST', 'cost')
+_K_TRAITS = _PROPS.get('TRAITS', 'traits')
+_K_TEXT = _PROPS.get('TEXT', 'text')
+_K_TYPE = _PROPS.get('TYPE', 'type')
+_K_IS_REST = _PROPS.get('IS_REST', 'is_rest')
+_K_IS_FACE_UP = _PROPS.get('IS_FACE_UP', 'is_face_up')
+_K_ATTACHED_DON = _PROPS.get('ATTACHED_DON', 'attached_don')
+_K_OWNER_ID = _PROPS.get('OWNER_ID', 'owner_id')
+_K_KEYWORDS = _PROPS.get('KEYWORDS', 'keywords')
+_K_TRIGGER_TEXT = _PROPS.get('TRIGGER_TEXT', 'trigger_text')
+_K_ABILITY_DISABLED = _PROPS.get('ABILITY_DISABLED', 'ability_disabled')
+_K_IS_FROZEN = _PROPS.get('IS_FROZEN', 'is_frozen')
+
 
 # opcg_sim/src/models/models.py
 
@@ -45,6 +67,56 @@ class CardMaster:
         memo[id(self)] = self
         return self
 
+    @cached_property
+    def abilities_by_trigger(self) -> Dict[Any, Tuple[Ability, ...]]:
+        """abilities をトリガー種別ごとに束ねた辞書（各束は定義順を保持）。
+        フェイズ遷移/攻撃宣言のたびに全能力を走査して trigger を比較する代わりに
+        `master.abilities_by_trigger.get(TriggerType.X, ())` で該当能力だけを引く。
+        CardMaster は不変なので初回アクセス時に1度だけ構築する（cached_property は
+        __dict__ へ直接書くため frozen でも動作し、deepcopy も self 共有のまま）。"""
+        buckets: Dict[Any, List[Ability]] = {}
+        for ab in self.abilities:
+            buckets.setdefault(ab.trigger, []).append(ab)
+        return {t: tuple(abs_) for t, abs_ in buckets.items()}
+
+    @cached_property
+    def is_counter_event(self) -> bool:
+        """【カウンター】能力を持つイベントか。BATTLE_COUNTER の候補列挙は問い合わせの
+        たびに手札全体を見るため、種別と能力の判定をカード定義ごとに1度へまとめる。"""
+        return self.type == CardType.EVENT and TriggerType.COUNTER in self.abilities_by_trigger
+
+    @cached_property
+    def has_power(self) -> bool:
+        """パワーを持つ種別（リーダー/キャラ）か。get_power はバトル・効果条件・UI 送信のたびに
+        呼ばれるため、Enum 比較2回を定義ごとに1度の判定へまとめる。"""
+        return self.type == CardType.LEADER or self.type == CardType.CHARACTER
+
+    @cached_property
+    def ui_template(self) -> Dict[str, Any]:
+        """CardInstance.to_dict の雛形（キー順は送信形式どおり）。カード定義だけで決まる値は
+        ここで1度だけ埋め、実行時状態の項目は None の枠として置く。to_dict は浅コピーして
+        枠を上書きするだけになる（traits は呼び出し側へ渡すたびに複製する）。"""
+        return {
+            _K_UUID: None,
+            _K_CARD_ID: self.card_id,
+            _K_NAME: self.name,
+            _K_POWER: None,
+            _K_COUNTER: self.counter,
+            _K_ATTRIBUTE: self.attribute.value,
+            _K_COST: None,
+            _K_TRAITS: None,
+            _K_TEXT: self.effect_text,
+            _K_TYPE: self.type.value,
+            _K_IS_REST: None,
+            _K_IS_FACE_UP: None,
+            _K_ATTACHED_DON: None,
+            _K_OWNER_ID: None,
+            _K_KEYWORDS: None,
+            _K_TRIGGER_TEXT: self.trigger_text or '',
+            _K_ABILITY_DISABLED: None,
+            _K_IS_FROZEN: None,
+        }
+
     @property
     def all_names(self) -> List[str]:
         """カードが名乗る全カード名（本来名＋ルール上の別名）。"""
@@ -160,18 +232,13 @@ class CardInstance:
         return new
 
     def _refresh_keywords(self):
+        # 本来のキーワードはパース時に CardMaster.keywords へ確定済み。Ability は actions を
+        # 持たない（効果木は effect/cost）ため、能力を走査して KEYWORD を拾う処理は常に空振りで、
+        # reset_turn_status のたびに全能力へ hasattr するだけだった。ここではコピーのみ行う。
         if self.ability_disabled:
             self.current_keywords = JournaledSet()
             return
         self.current_keywords = JournaledSet(self.master.keywords)
-        for ability in self.master.abilities:
-            if not hasattr(ability, 'actions'):
-                continue
-            for action in ability.actions:
-                if action.type == ActionType.KEYWORD:
-                    keyword_val = getattr(action, 'details', None)
-                    if keyword_val:
-                        self.current_keywords.add(keyword_val)
 
     @property
     def is_effect_negated(self) -> bool:
@@ -190,7 +257,7 @@ class CardInstance:
         return keyword in self.current_keywords or keyword in self.timed_keywords
 
     def get_power(self, is_my_turn: bool) -> int:
-        if self.master.type not in [CardType.LEADER, CardType.CHARACTER]:
+        if not self.master.has_power:
             return 0
         override = (self.base_power_override if self.base_power_override is not None
                     else self.passive_power_override)
@@ -237,29 +304,46 @@ class CardInstance:
         self.is_newly_played = False
         self._refresh_keywords()
 
-    def to_dict(self, is_my_turn: bool = True):
-        props = CONST.get('CARD_PROPERTIES', {})
-        return {
-            props.get('UUID', 'uuid'): self.uuid,
-            props.get('CARD_ID', 'card_id'): self.master.card_id,
-            props.get('NAME', 'name'): self.master.name,
-            # 付与ドン!!のパワーは自分のターン中のみ反映する（相手ターンは加算しない）。
-            props.get('POWER', 'power'): self.get_power(is_my_turn=is_my_turn),
-            props.get('COUNTER', 'counter'): self.master.counter,
-            props.get('ATTRIBUTE', 'attribute'): self.master.attribute.value,
-            props.get('COST', 'cost'): self.current_cost,
-            props.get('TRAITS', 'traits'): list(self.master.traits),
-            props.get('TEXT', 'text'): self.master.effect_text,
-            props.get('TYPE', 'type'): self.master.type.value,
-            props.get('IS_REST', 'is_rest'): self.is_rest,
-            props.get('IS_FACE_UP', 'is_face_up'): self.is_face_up,
-            props.get('ATTACHED_DON', 'attached_don'): self.attached_don,
-            props.get('OWNER_ID', 'owner_id'): self.owner_id,
-            props.get('KEYWORDS', 'keywords'): list(self.current_keywords | self.timed_keywords),
-            props.get('TRIGGER_TEXT', 'trigger_text'): self.master.trigger_text or '',
-            props.get('ABILITY_DISABLED', 'ability_disabled'): self.ability_disabled,
-            props.get('IS_FROZEN', 'is_frozen'): 'FREEZE' in self.flags,
-        }
+    def to_dict(self, is_my_turn: bool = True, face_up: Optional[bool] = None):
+        """UI 送信用の辞書。face_up を渡すと is_face_up を表示側の可視性（手札の所有者可視・
+        ライフの表向き等）で上書きする（Player.to_dict が後から書き換える dict 再代入を省く）。"""
+        # 効果で書き換わる状態（flags/キーワード集合の in-place 変更を含む）は汚れフラグで追えない
+        # ため毎回読む。カード定義由来の不変項目は CardMaster.ui_template から浅コピーで引き継ぐ。
+        d = self.master.ui_template.copy()
+        d[_K_UUID] = self.uuid
+        # 付与ドン!!のパワーは自分のターン中のみ反映する（相手ターンは加算しない）。
+        d[_K_POWER] = self.get_power(is_my_turn=is_my_turn)
+        d[_K_COST] = self.current_cost
+        d[_K_TRAITS] = list(self.master.traits)
+        d[_K_IS_REST] = self.is_rest
+        d[_K_IS_FACE_UP] = self.is_face_up if face_up is None else face_up
+        d[_K_ATTACHED_DON] = self.attached_don
+        d[_K_OWNER_ID] = self.owner_id
+        d[_K_KEYWORDS] = list(self.current_keywords | self.timed_keywords)
+        d[_K_ABILITY_DISABLED] = self.ability_disabled
+        d[_K_IS_FROZEN] = 'FREEZE' in self.flags
+        return d
+
+# DonInstance.to_dict の雛形（キー順は送信形式どおり）。CardSchema のバリデーションを通すための
+# ダミー値（power/cost 等）はどのドン!!でも同じなので1度だけ作る。None の枠は to_dict が埋める。
+_DON_UI_TEMPLATE: Dict[str, Any] = {
+    _K_UUID: None,
+    _K_OWNER_ID: None,
+    _K_IS_REST: None,
+    "attached_to": None,
+    _K_CARD_ID: "DON",
+    _K_NAME: None,
+    _K_TYPE: "DON",
+    _K_ATTRIBUTE: "Special",
+    _K_POWER: 0,
+    _K_COST: 0,
+    _K_COUNTER: 0,
+    _K_TRAITS: None,
+    _K_TEXT: "",
+    _K_IS_FACE_UP: True,
+    _K_ATTACHED_DON: 0,
+    _K_KEYWORDS: None,
+}
 
 @dataclass(eq=False)  # CardInstance と同趣旨: ドン!!も固有実体＝同一性比較（高速・hashable）。
 class DonInstance:
@@ -285,7 +369,6 @@ class DonInstance:
         return new
 
     def to_dict(self):
-        props = CONST.get('CARD_PROPERTIES', {})
         # ドン!!返却の選択 UI 等で状態を区別できるよう、名前に付与中/レストを併記する。
         if self.attached_to:
             display_name = "ドン!!(付与中)"
@@ -293,22 +376,14 @@ class DonInstance:
             display_name = "ドン!!(レスト)"
         else:
             display_name = "ドン!!"
-        return {
-            props.get('UUID', 'uuid'): self.uuid,
-            props.get('OWNER_ID', 'owner_id'): self.owner_id,
-            props.get('IS_REST', 'is_rest'): self.is_rest,
-            "attached_to": self.attached_to,
-            props.get('CARD_ID', 'card_id'): "DON",
-            # 【追加】CardSchemaのバリデーションを通すためのダミー値
-            props.get('NAME', 'name'): display_name,
-            props.get('TYPE', 'type'): "DON",
-            props.get('ATTRIBUTE', 'attribute'): "Special",
-            props.get('POWER', 'power'): 0,
-            props.get('COST', 'cost'): 0,
-            props.get('COUNTER', 'counter'): 0,
-            props.get('TRAITS', 'traits'): [],
-            props.get('TEXT', 'text'): "",
-            props.get('IS_FACE_UP', 'is_face_up'): True,
-            props.get('ATTACHED_DON', 'attached_don'): 0,
-            props.get('KEYWORDS', 'keywords'): []
-        }
+        # 固定値は _DON_UI_TEMPLATE から浅コピーし、状態の項目だけ埋める（CardInstance.to_dict の
+        # ui_template と同じ方式）。traits/keywords の空 list は呼び出し側へ渡すたびに新しく作る。
+        d = _DON_UI_TEMPLATE.copy()
+        d[_K_UUID] = self.uuid
+        d[_K_OWNER_ID] = self.owner_id
+        d[_K_IS_REST] = self.is_rest
+        d["attached_to"] = self.attached_to
+        d[_K_NAME] = display_name
+        d[_K_TRAITS] = []
+        d[_K_KEYWORDS] = []
+        return d
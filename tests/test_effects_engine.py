@@ -509,6 +509,70 @@ def test_life_to_hand_move_card():
     assert life_card not in p1.life
 
 
+def test_move_card_within_same_zone_keeps_order_semantics():
+    """同一ゾーン内の移動: 既に行き先の端にあれば並びは不変、そうでなければ端へ移る。"""
+    gm, p1, _ = make_game()
+    cards = [make_instance(make_master(card_id=f"D-{i}"), owner=p1.name) for i in range(3)]
+    p1.deck.extend(cards)
+
+    gm.move_card(cards[2], Zone.DECK, p1, dest_position="BOTTOM")   # 既に末尾
+    assert list(p1.deck) == cards
+    gm.move_card(cards[0], Zone.DECK, p1, dest_position="BOTTOM")   # 先頭→末尾
+    assert list(p1.deck) == [cards[1], cards[2], cards[0]]
+    gm.move_card(cards[0], Zone.DECK, p1, dest_position="TOP")      # 末尾→先頭
+    assert list(p1.deck) == cards
+
+
+def test_find_card_location_survives_direct_zone_edits():
+    """所在ヒントは検証してから使う: move_card を経ずにゾーンを直接書き換えても実際の所在を返す。"""
+    gm, p1, p2 = make_game()
+    card = make_instance(make_master(card_id="LOC"), owner=p1.name)
+    p1.hand.append(card)
+    gm.move_card(card, Zone.TRASH, p1)                   # ヒント = p1.trash
+    assert gm._find_card_location(card) == (p1, p1.trash)
+    p1.trash.remove(card); p1.deck.append(card)          # ヒントを経ない直接移動
+    owner, zone = gm._find_card_location(card)
+    assert owner is p1 and zone is p1.deck
+    p1.deck = [card]                                     # ゾーン list ごと差し替え
+    assert gm._find_card_location(card)[1] is p1.deck
+    p1.deck.clear()
+    assert gm._find_card_location(card) == (None, None)
+
+
+def test_find_card_by_uuid_survives_direct_zone_edits():
+    """uuid 検索も所在ヒントを検証してから使う: 外れたら全探索、ドン!!は返さない。"""
+    from opcg_sim.src.models.models import DonInstance
+    gm, p1, p2 = make_game()
+    card = make_instance(make_master(card_id="UID"), owner=p2.name)
+    p2.hand.append(card)
+    gm.move_card(card, Zone.TRASH, p2)                   # ヒント = p2.trash
+    assert gm._find_card_by_uuid(card.uuid) is card
+    p2.trash.remove(card); p2.life.append(card)          # ヒントを経ない直接移動
+    assert gm._find_card_by_uuid(card.uuid) is card
+    p2.life.clear()
+    assert gm._find_card_by_uuid(card.uuid) is None
+    don = DonInstance(owner_id=p1.name)
+    p1.don_active.append(don)
+    gm._find_card_location(don)                          # ドン!!の所在もヒントに載る
+    assert gm._find_card_by_uuid(don.uuid) is None
+
+
+def test_seeded_rng_makes_shuffle_reproducible():
+    """GameManager.rng を渡すとシャッフルはその乱数列だけで決まる（グローバル random に非依存）。"""
+    import random
+
+    def _order(seed):
+        gm, p1, _ = make_game()
+        gm.rng = random.Random(seed)
+        p1.deck.extend(make_instance(make_master(card_id=f"D-{i}"), owner=p1.name) for i in range(20))
+        random.random()                                  # グローバル乱数を進めても影響しない
+        gm.apply_action_to_engine(p1, action(ActionType.SHUFFLE), [], 0)
+        return [c.master.card_id for c in p1.deck]
+
+    assert _order(7) == _order(7)
+    assert _order(7) != [f"D-{i}" for i in range(20)]
+
+
 def test_face_up_life_sets_flag():
     """FACE_UP_LIFE: status で is_face_up を切り替える。"""
     gm, p1, _ = make_game()
@@ -2371,6 +2435,28 @@ def test_on_block_ability_fires():
     assert len(p2.hand) == hand_before + 1, "ON_BLOCK のドローが発動するべき"
 
 
+def test_block_step_candidates_exclude_blocker_disabled():
+    """BLOCK_STEP の候補は has_blocker と同じ判定: 「【ブロッカー】を発動できない」キャラは出さない。"""
+    from opcg_sim.src.models.enums import Phase
+    gm, p1, p2 = make_game()
+    ok_blk = make_instance(make_master(card_id="C-B1", name="壁1"), owner="P2")
+    off_blk = make_instance(make_master(card_id="C-B2", name="壁2"), owner="P2")
+    for b in (ok_blk, off_blk):
+        b.current_keywords.add("ブロッカー")
+        p2.field.append(b)
+    off_blk.flags.add("BLOCKER_DISABLED")
+    attacker = make_instance(make_master(card_id="C-ATK", name="攻撃役", power=5000), owner="P1")
+    p1.field.append(attacker)
+    gm.turn_player, gm.opponent = p1, p2
+    gm.turn_count = 3
+    gm.phase = Phase.MAIN
+    gm.declare_attack(attacker, p2.leader)
+    cov_drain(gm)
+    assert gm.phase == Phase.BLOCK_STEP
+    req = gm.get_pending_request()
+    assert req["selectable_uuids"] == [ok_blk.uuid]
+
+
 def test_this_battle_buff_expires_on_resolve():
     """H-6: THIS_BATTLE のパワー増は resolve_attack（バトル終了）で失効する。"""
     gm, p1, p2 = make_game()
@@ -2497,3 +2583,57 @@ def test_v2_is_active_by_default():
 def cov_drain(gm):
     import effect_coverage as _cov
     _cov._smart_drain(gm, record={})
+
+
+def test_card_to_dict_reflects_in_place_state_and_isolates_template():
+    """to_dict はカード定義の雛形を共有するが、返す辞書は呼び出しごとに独立し、
+    flags/キーワードの in-place 変更も次の呼び出しに反映される。"""
+    master = make_master(card_id="C-TD", name="辞書化")
+    a = make_instance(master, owner="P1")
+    b = make_instance(master, owner="P1")
+    d1 = a.to_dict()
+    d1["traits"].append("改変")
+    d1["name"] = "改変"
+    a.flags.add("FREEZE")
+    a.current_keywords.add("ブロッカー")
+    d2 = a.to_dict()
+    assert d2["name"] == "辞書化" and "改変" not in d2["traits"]
+    assert d2["is_frozen"] is True and "ブロッカー" in d2["keywords"]
+    assert b.to_dict()["is_frozen"] is False and b.to_dict()["uuid"] == b.uuid
+
+
+def test_main_action_selectable_follows_direct_zone_edits():
+    """MAIN_ACTION の候補は問い合わせごとに盤面から作る: is_rest/手札を直接書き換えても即座に反映される
+    （効果処理・テストは領域リストや is_rest をフック無しで直接編集するため、候補を保持してはならない）。"""
+    from opcg_sim.src.models.enums import Phase
+    gm, p1, p2 = make_game()
+    gm.turn_player, gm.opponent = p1, p2
+    gm.phase = Phase.MAIN
+    ch = make_instance(make_master(card_id="C-MA1", name="場"), owner="P1")
+    p1.field.append(ch)
+    assert ch.uuid in gm.get_pending_request()["selectable_uuids"]
+    ch.is_rest = True
+    assert ch.uuid not in gm.get_pending_request()["selectable_uuids"]
+    drawn = make_instance(make_master(card_id="C-MA2", name="手札"), owner="P1")
+    p1.hand.append(drawn)
+    sel = gm.get_pending_request()["selectable_uuids"]
+    assert drawn.uuid in sel and sel.count(drawn.uuid) == 1
+
+
+def test_passive_reset_keeps_current_keywords_journaled():
+    """PASSIVE 再計算が current_keywords を本来のキーワードへ戻すとき、journaled 型のまま戻す。
+    素の set だと、その後の in-place 変更（BLOCKER_DISABLE の discard）が探索の巻き戻しで戻らない。"""
+    import dataclasses
+    from opcg_sim.src.core import journal
+    from opcg_sim.src.core.journal import JournaledSet
+    gm, p1, p2 = make_game()
+    master = dataclasses.replace(make_master(card_id="C-KW", name="壁"), keywords={"ブロッカー"})
+    blk = make_instance(master, owner="P2")
+    p2.field.append(blk)
+    blk.current_keywords = JournaledSet()
+    gm._apply_passive_effects(p1)
+    assert blk.current_keywords == {"ブロッカー"}
+    assert isinstance(blk.current_keywords, JournaledSet)
+    with journal.transaction():
+        blk.current_keywords.discard("ブロッカー")
+    assert "ブロッカー" in blk.current_keywords
@@ -83,3 +83,15 @@ def test_main_event_still_playable():
     gm.play_card_action(p1, gear)
     # イベントは発動後トラッシュへ（【メイン】解決が中断しなければ）
     assert gear not in p1.hand
+
+
+def test_play_card_not_in_hand_is_noop():
+    """手札に無いカードの play_card_action は何もしない（盤面不変）。手札は効果/テストから
+    list ごと差し替えられるため、所在判定は並行する索引でなく手札そのものを見る。"""
+    gm, p1, p2, L = _setup(["OP11-080"])
+    gear = p1.hand[0]
+    p1.hand = []                                 # 手札の差し替え直後でも正しく弾く
+    don_before = len(p1.don_active)
+    gm.play_card_action(p1, gear)
+    assert gear not in p1.trash and not p1.hand
+    assert len(p1.don_active) == don_before